@@ -5,13 +5,36 @@ Uses MCP tools for data access instead of direct database queries.
 """
 
 from langchain_openai import ChatOpenAI
+from openai import AsyncOpenAI
+from langchain_core.messages import SystemMessage
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+import asyncio
 import json
+import logging
+import os
+import re
+from collections import defaultdict
+
+import orjson
 
 from .mcp_client import MCPClientManager
 from ..prompts import load_prompt
 
+logger = logging.getLogger(__name__)
+
+# Templated pulse-check scaffolding does not need the large model; ops can
+# override both via the environment to A/B test.
+SURVEY_MODEL = os.getenv("SURVEY_MODEL", "gpt-4o-mini")
+# Used only when impulse history reveals weak areas the questions must target.
+SURVEY_ESCALATION_MODEL = os.getenv("SURVEY_ESCALATION_MODEL", "gpt-4o")
+# Upper bound on concurrent LLM calls when generating for several groups,
+# to stay within the OpenAI requests-per-minute limit.
+SURVEY_MAX_CONCURRENCY = int(os.getenv("SURVEY_MAX_CONCURRENCY", "5"))
+
+# Extracts the JSON object from a ```json ... ``` (or bare ```) fenced block
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
 
 class SurveyQuestion(BaseModel):
     """A single survey question."""
@@ -34,7 +57,16 @@ class SurveyAgent:
     """Agent that generates surveys based on stakeholder context."""
 
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
+        self.llm = ChatOpenAI(model=SURVEY_MODEL, temperature=0.7)
+        self.escalation_llm = ChatOpenAI(model=SURVEY_ESCALATION_MODEL, temperature=0.7)
+
+        # The system message is byte-identical for every request so OpenAI can
+        # serve it from the prompt cache; all per-request data goes into the
+        # human turn. A ChatPromptTemplate is avoided because the JSON format
+        # contains braces.
+        self.system_message = SystemMessage(
+            content=load_prompt("survey", "system") + load_prompt("survey", "json_format")
+        )
 
     async def generate_survey_for_group(self, group_id: str) -> Survey:
         """
@@ -112,6 +144,57 @@ class SurveyAgent:
             impulse_history=impulse_history
         )
 
+    async def generate_surveys_for_groups(
+        self,
+        project_goal: str,
+        project_name: Optional[str],
+        groups: List[dict]
+    ) -> List[Optional[Survey]]:
+        """
+        Generate surveys for several stakeholder groups of one project concurrently.
+
+        The LLM calls are network-bound, so running them in parallel brings the
+        wall-clock time down to roughly that of the slowest group.
+
+        Args:
+            project_goal: The project's goal/description
+            project_name: Name of the project
+            groups: One dict per group with the remaining generate_survey
+                arguments (group_name, group_type, mendelow_quadrant,
+                mendelow_strategy, impulse_history)
+
+        Returns:
+            List of surveys in the same order as groups; None for groups whose
+            generation failed, so one failure does not cancel the others
+        """
+        semaphore = asyncio.Semaphore(SURVEY_MAX_CONCURRENCY)
+
+        async def generate(group: dict) -> Survey:
+            async with semaphore:
+                return await self._generate_with_context(
+                    project_goal=project_goal,
+                    project_name=project_name,
+                    **group
+                )
+
+        results = await asyncio.gather(
+            *(generate(group) for group in groups),
+            return_exceptions=True
+        )
+
+        surveys = []
+        for group, result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Error generating survey for group %s: %s",
+                    group.get("group_name") or group.get("group_type"),
+                    result,
+                )
+                surveys.append(None)
+            else:
+                surveys.append(result)
+        return surveys
+
     async def _generate_with_context(
         self,
         project_goal: str,
@@ -125,6 +208,152 @@ class SurveyAgent:
         """
         Internal method to generate survey with provided context.
         """
+        user_message, weak_areas = self._build_user_message(
+            project_goal=project_goal,
+            project_name=project_name,
+            group_name=group_name,
+            group_type=group_type,
+            mendelow_quadrant=mendelow_quadrant,
+            mendelow_strategy=mendelow_strategy,
+            impulse_history=impulse_history
+        )
+
+        # Use direct message list to avoid template escaping issues
+        messages = [
+            self.system_message,
+            ("human", user_message)
+        ]
+
+        # Weak areas need stronger reasoning to turn into targeted questions
+        llm = self.escalation_llm if weak_areas else self.llm
+        response = await llm.ainvoke(messages)
+
+        return self._parse_survey(response.content)
+
+    async def generate_surveys_batch(self, jobs: List[dict]) -> str:
+        """
+        Submit survey generation for many groups to the OpenAI Batch API.
+
+        Intended for non-urgent bulk runs (e.g. an organisation-wide rollout):
+        batch requests cost half as much and do not count against the
+        synchronous rate limits, but results arrive within 24 hours.
+
+        Args:
+            jobs: One dict per survey with a unique "group_id" plus the
+                generate_survey arguments for that group
+
+        Returns:
+            The OpenAI batch ID, to be passed to collect_batch
+        """
+        lines = []
+        for job in jobs:
+            job = dict(job)
+            group_id = job.pop("group_id")
+            user_message, weak_areas = self._build_user_message(**job)
+            llm = self.escalation_llm if weak_areas else self.llm
+            lines.append(json.dumps({
+                "custom_id": group_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": llm.model_name,
+                    "temperature": llm.temperature,
+                    "messages": [
+                        {"role": "system", "content": self.system_message.content},
+                        {"role": "user", "content": user_message},
+                    ],
+                },
+            }, ensure_ascii=False))
+
+        client = AsyncOpenAI()
+        batch_file = await client.files.create(
+            file=("surveys.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    async def collect_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 60.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Optional[Survey]]:
+        """
+        Wait for a batch submitted via generate_surveys_batch and parse its results.
+
+        Args:
+            batch_id: The ID returned by generate_surveys_batch
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Dict mapping group_id -> Survey, or None if that request failed
+        """
+        client = AsyncOpenAI()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise ValueError(f"Survey batch {batch_id} ended with status '{batch.status}'")
+            if deadline is not None and loop.time() >= deadline:
+                raise TimeoutError(f"Survey batch {batch_id} still '{batch.status}' after {timeout}s")
+            await asyncio.sleep(poll_interval)
+
+        surveys: Dict[str, Optional[Survey]] = {}
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for result in self._batch_results(output.text):
+                group_id = result["custom_id"]
+                try:
+                    content = result["response"]["body"]["choices"][0]["message"]["content"]
+                    surveys[group_id] = self._parse_survey(content)
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    logger.warning("Error parsing batched survey for group %s: %s", group_id, e)
+                    surveys[group_id] = None
+
+        # Requests the Batch API rejected only appear in the error file
+        if batch.error_file_id:
+            errors = await client.files.content(batch.error_file_id)
+            for result in self._batch_results(errors.text):
+                group_id = result["custom_id"]
+                logger.warning(
+                    "Batched survey request for group %s failed: %s",
+                    group_id,
+                    result.get("error") or result.get("response"),
+                )
+                surveys[group_id] = None
+        return surveys
+
+    @staticmethod
+    def _batch_results(text: str) -> List[dict]:
+        """Parse the JSONL content of a batch output or error file."""
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    def _build_user_message(
+        self,
+        project_goal: str,
+        project_name: Optional[str],
+        group_name: str,
+        group_type: str,
+        mendelow_quadrant: str,
+        mendelow_strategy: str,
+        impulse_history: List[dict]
+    ) -> Tuple[str, List[str]]:
+        """
+        Build the localized user message for a survey request.
+
+        Returns:
+            Tuple of (user message, identified weak areas)
+        """
         # Load localized labels
         history_header = load_prompt("survey", "history_header")
         history_line_template = load_prompt("survey", "history_line")
@@ -134,35 +363,41 @@ class SurveyAgent:
         history_unknown_date = load_prompt("survey", "history_unknown_date")
 
         # Build context from impulse history
-        history_context = ""
+        history_parts = []
+        weak_areas = []
         if impulse_history:
-            history_context = "\n" + history_header
+            history_parts.append("\n" + history_header)
             for impulse in impulse_history[:5]:
                 date = impulse.get('date', history_unknown_date)
                 avg = impulse.get('average_rating', 'N/A')
-                history_context += history_line_template.format(date=date, average=avg) + "\n"
+                history_parts.append(history_line_template.format(date=date, average=avg) + "\n")
                 ratings = impulse.get('ratings', {})
                 if ratings:
                     for key, value in ratings.items():
-                        history_context += history_rating_template.format(key=key, value=value) + "\n"
+                        history_parts.append(history_rating_template.format(key=key, value=value) + "\n")
 
             # Identify weak areas
-            all_ratings = {}
+            sums = defaultdict(float)
+            counts = defaultdict(int)
             for impulse in impulse_history:
                 for key, value in impulse.get('ratings', {}).items():
-                    if key not in all_ratings:
-                        all_ratings[key] = []
-                    all_ratings[key].append(value)
+                    sums[key] += value
+                    counts[key] += 1
+
+            for key, total in sums.items():
+                avg = total / counts[key]
+                if avg < 6:
+                    weak_areas.append(f"{key} ({history_average_label}: {avg:.1f})")
+
+            if weak_areas:
+                history_parts.append("\n" + history_weaknesses_template.format(weaknesses=", ".join(weak_areas)) + "\n")
 
-            if all_ratings:
-                weak_areas = []
-                for key, values in all_ratings.items():
-                    avg = sum(values) / len(values)
-                    if avg < 6:
-                        weak_areas.append(f"{key} ({history_average_label}: {avg:.1f})")
+        if not weak_areas:
+            # Without weak areas to target, the indicator reference gives the
+            # questions a basis. Weak areas already cover it, saving prompt tokens.
+            history_parts.append(load_prompt("survey", "indicators_reference"))
 
-                if weak_areas:
-                    history_context += "\n" + history_weaknesses_template.format(weaknesses=", ".join(weak_areas)) + "\n"
+        history_context = "".join(history_parts)
 
         # Build user message from localized template
         project_display_name = project_name or "Change Project"
@@ -178,31 +413,22 @@ class SurveyAgent:
             history_context=history_context
         )
 
-        # Build system message from localized prompts
-        system_prompt = load_prompt("survey", "system")
-        json_format = load_prompt("survey", "json_format")
-        system_message = system_prompt + json_format
-
-        # Use direct message list to avoid template escaping issues
-        messages = [
-            ("system", system_message),
-            ("human", user_message)
-        ]
-
-        response = await self.llm.ainvoke(messages)
+        return user_message, weak_areas
 
-        # Parse the response
-        content = response.content
-        # Try to find JSON in the response
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+    @staticmethod
+    def _parse_survey(content: str) -> Survey:
+        """Parse an LLM response into a Survey, tolerating markdown code fences."""
+        # Raw JSON is the common case; only search for a code fence otherwise
+        content = content.strip()
+        if not content.startswith("{"):
+            match = _JSON_FENCE_RE.search(content)
+            if match:
+                content = match.group(1)
 
         try:
-            survey_data = json.loads(content)
-            return Survey(**survey_data)
-        except json.JSONDecodeError as e:
+            survey_data = orjson.loads(content)
+            return Survey.model_validate(survey_data)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Failed to parse survey response as JSON: {e}. Raw content: {content[:500]}")
         except Exception as e:
             raise ValueError(f"Failed to create survey from response: {e}. Raw content: {content[:500]}")
@@ -2,10 +2,32 @@
 Web Search Tool - uses Tavily API for AI-optimized web search.
 """
 
+import asyncio
 import os
+from typing import Optional, Union
 from langchain_core.tools import tool
 from tavily import TavilyClient
 
+try:
+    from tavily import AsyncTavilyClient
+except ImportError:  # Older tavily-python releases only ship the sync client
+    AsyncTavilyClient = None
+
+# Shared client so HTTP keep-alive connections are reused across searches
+_TAVILY_CLIENT: Optional[Union[TavilyClient, "AsyncTavilyClient"]] = None
+
+
+def _get_client() -> Optional[Union[TavilyClient, "AsyncTavilyClient"]]:
+    """Return the shared Tavily client, creating it on first use."""
+    global _TAVILY_CLIENT
+    if _TAVILY_CLIENT is None:
+        api_key = os.getenv("TAVILY_API_KEY")
+        if not api_key:
+            return None
+        client_class = AsyncTavilyClient or TavilyClient
+        _TAVILY_CLIENT = client_class(api_key=api_key)
+    return _TAVILY_CLIENT
+
 
 @tool
 async def web_search(query: str, num_results: int = 5) -> str:
@@ -17,28 +39,31 @@ async def web_search(query: str, num_results: int = 5) -> str:
         query: The search query
         num_results: Number of results to return (default 5, max 10)
     """
-    api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key:
+    client = _get_client()
+    if client is None:
         return "Error: TAVILY_API_KEY not configured. Please add it to the .env file."
 
     try:
-        client = TavilyClient(api_key=api_key)
-
         # Limit results to reasonable range
         num_results = min(max(1, num_results), 10)
 
-        results = client.search(
+        search_kwargs = dict(
             query=query,
             max_results=num_results,
             include_raw_content=False,
             search_depth="basic"
         )
+        if AsyncTavilyClient is not None:
+            results = await client.search(**search_kwargs)
+        else:
+            # Keep the blocking HTTP call off the event loop
+            results = await asyncio.to_thread(client.search, **search_kwargs)
 
         if not results.get("results"):
             return f"No results found for: {query}"
 
         # Format as markdown
-        output = f"## Web Search Results: {query}\n\n"
+        parts = [f"## Web Search Results: {query}\n\n"]
         sources = []
 
         for i, result in enumerate(results.get("results", []), 1):
@@ -46,19 +71,18 @@ async def web_search(query: str, num_results: int = 5) -> str:
             content = result.get("content", "No description available")
             url = result.get("url", "")
 
-            output += f"### {i}. {title}\n"
-            output += f"{content}\n\n"
+            parts.append(f"### {i}. {title}\n{content}\n\n")
 
             if url:
                 sources.append({"title": title, "url": url})
 
         # Add sources section
         if sources:
-            output += "---\n\n## Sources\n"
+            parts.append("---\n\n## Sources\n")
             for source in sources:
-                output += f"- [{source['title']}]({source['url']})\n"
+                parts.append(f"- [{source['title']}]({source['url']})\n")
 
-        return output
+        return "".join(parts)
 
     except Exception as e:
         return f"Web search error: {str(e)}"
@@ -3,10 +3,31 @@ Fixed indicators (Bewertungsfaktoren) for change management projects.
 These are predefined for ALL projects and not user-created.
 
 All text is loaded from localized YAML files based on the LOCALE environment variable.
+The YAML is only read when a constant is first accessed, not at import time.
 """
 
-from typing import Dict, List, TypedDict
-from .prompts import load_constants
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Tuple, TypedDict, Union
+from .prompts import constants_cache, load_constants
+
+
+class GroupType(str, Enum):
+    """Stakeholder group types. Members compare and hash equal to their plain string values."""
+    FUEHRUNGSKRAEFTE = "fuehrungskraefte"
+    MULTIPLIKATOREN = "multiplikatoren"
+    MITARBEITENDE = "mitarbeitende"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class MendelowLevel(str, Enum):
+    """Power/interest level on one axis of the Mendelow matrix."""
+    HIGH = "high"
+    LOW = "low"
+
+    def __str__(self) -> str:
+        return self.value
 
 
 class IndicatorDefinition(TypedDict):
@@ -22,72 +43,110 @@ def _load_indicators() -> tuple[List[IndicatorDefinition], List[IndicatorDefinit
     return core, fuehrungskraefte
 
 
-def _load_stakeholder_group_types(core_indicators, fuehrungskraefte_indicators) -> Dict:
+def _load_stakeholder_group_types(core_indicators, fuehrungskraefte_indicators) -> Dict[GroupType, Dict]:
     """Load stakeholder group types from localized constants."""
     types_data = load_constants("stakeholder_group_types")
+    indicators_by_type = {
+        GroupType.FUEHRUNGSKRAEFTE: fuehrungskraefte_indicators,
+        GroupType.MULTIPLIKATOREN: core_indicators,
+        GroupType.MITARBEITENDE: core_indicators,
+    }
 
     # Build the full structure with indicator references
     return {
-        "fuehrungskraefte": {
-            "name": types_data["fuehrungskraefte"]["name"],
-            "description": types_data["fuehrungskraefte"]["description"],
-            "indicators": fuehrungskraefte_indicators
-        },
-        "multiplikatoren": {
-            "name": types_data["multiplikatoren"]["name"],
-            "description": types_data["multiplikatoren"]["description"],
-            "indicators": core_indicators
-        },
-        "mitarbeitende": {
-            "name": types_data["mitarbeitende"]["name"],
-            "description": types_data["mitarbeitende"]["description"],
-            "indicators": core_indicators
+        group_type: {
+            "name": types_data[group_type.value]["name"],
+            "description": types_data[group_type.value]["description"],
+            "indicators": indicators
         }
+        for group_type, indicators in indicators_by_type.items()
     }
 
 
-def _load_mendelow_quadrants() -> Dict:
+def _load_mendelow_quadrants() -> Dict[Tuple[MendelowLevel, MendelowLevel], Dict]:
     """Load Mendelow quadrants from localized constants."""
     quadrants_data = load_constants("mendelow_quadrants")
 
-    # Convert from YAML keys (high_high) to tuple keys (("high", "high"))
+    # Convert from YAML keys (high_high) to (power, interest) tuple keys.
+    # Plain string tuples such as ("high", "low") still match these keys.
     return {
-        ("high", "high"): quadrants_data["high_high"],
-        ("high", "low"): quadrants_data["high_low"],
-        ("low", "high"): quadrants_data["low_high"],
-        ("low", "low"): quadrants_data["low_low"],
+        (power, interest): quadrants_data[f"{power.value}_{interest.value}"]
+        for power in MendelowLevel
+        for interest in MendelowLevel
+    }
+
+
+@constants_cache
+def _get_constants() -> Dict[str, Any]:
+    """Load all constants from localized YAML files and derive lookup tables, once."""
+    core_indicators, fuehrungskraefte_indicators = _load_indicators()
+    stakeholder_group_types = _load_stakeholder_group_types(core_indicators, fuehrungskraefte_indicators)
+
+    # Core indicators take precedence if a key ever appears in both lists
+    indicator_by_key: Dict[str, IndicatorDefinition] = {
+        indicator["key"]: indicator
+        for indicator in reversed(core_indicators + fuehrungskraefte_indicators)
     }
 
+    indicators_by_group = {
+        group_type: info["indicators"] for group_type, info in stakeholder_group_types.items()
+    }
+
+    return {
+        "CORE_INDICATORS": core_indicators,
+        "FUEHRUNGSKRAEFTE_INDICATORS": fuehrungskraefte_indicators,
+        "STAKEHOLDER_GROUP_TYPES": stakeholder_group_types,
+        "MENDELOW_QUADRANTS": _load_mendelow_quadrants(),
+        # All unique indicator keys, for O(1) membership tests
+        "ALL_INDICATOR_KEYS": frozenset(indicator_by_key),
+        "_INDICATOR_BY_KEY": indicator_by_key,
+        "_INDICATORS_BY_GROUP": indicators_by_group,
+        "_INDICATOR_KEYS_BY_GROUP": {
+            group_type: tuple(indicator["key"] for indicator in indicators)
+            for group_type, indicators in indicators_by_group.items()
+        },
+    }
+
+
+_LAZY_CONSTANTS = frozenset({
+    "CORE_INDICATORS",
+    "FUEHRUNGSKRAEFTE_INDICATORS",
+    "STAKEHOLDER_GROUP_TYPES",
+    "MENDELOW_QUADRANTS",
+    "ALL_INDICATOR_KEYS",
+})
+
+
+def __getattr__(name: str) -> Any:
+    """Materialize the public constants on first access (PEP 562)."""
+    if name in _LAZY_CONSTANTS:
+        return _get_constants()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_indicators_for_group_type(group_type: Union[str, GroupType]) -> List[IndicatorDefinition]:
+    """
+    Get the list of indicators for a given stakeholder group type.
+
+    Raises ValueError if group_type is not a GroupType value.
+    """
+    return _get_constants()["_INDICATORS_BY_GROUP"][GroupType(group_type)]
 
-# Load all constants from localized YAML files
-CORE_INDICATORS, FUEHRUNGSKRAEFTE_INDICATORS = _load_indicators()
-STAKEHOLDER_GROUP_TYPES = _load_stakeholder_group_types(CORE_INDICATORS, FUEHRUNGSKRAEFTE_INDICATORS)
-MENDELOW_QUADRANTS = _load_mendelow_quadrants()
 
+def get_indicator_keys_for_group_type(group_type: Union[str, GroupType]) -> Tuple[str, ...]:
+    """
+    Get the indicator keys for a given stakeholder group type, in display order.
 
-def get_indicators_for_group_type(group_type: str) -> List[IndicatorDefinition]:
-    """Get the list of indicators for a given stakeholder group type."""
-    if group_type not in STAKEHOLDER_GROUP_TYPES:
-        return CORE_INDICATORS
-    return STAKEHOLDER_GROUP_TYPES[group_type]["indicators"]
+    Raises ValueError if group_type is not a GroupType value.
+    """
+    return _get_constants()["_INDICATOR_KEYS_BY_GROUP"][GroupType(group_type)]
 
 
-def get_all_indicator_keys() -> List[str]:
+def get_all_indicator_keys() -> FrozenSet[str]:
     """Get all unique indicator keys."""
-    all_keys = set()
-    for indicator in CORE_INDICATORS:
-        all_keys.add(indicator["key"])
-    for indicator in FUEHRUNGSKRAEFTE_INDICATORS:
-        all_keys.add(indicator["key"])
-    return list(all_keys)
+    return _get_constants()["ALL_INDICATOR_KEYS"]
 
 
 def get_indicator_by_key(key: str) -> IndicatorDefinition | None:
     """Get an indicator definition by its key."""
-    for indicator in CORE_INDICATORS:
-        if indicator["key"] == key:
-            return indicator
-    for indicator in FUEHRUNGSKRAEFTE_INDICATORS:
-        if indicator["key"] == key:
-            return indicator
-    return None
+    return _get_constants()["_INDICATOR_BY_KEY"].get(key)
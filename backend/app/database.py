@@ -1,311 +1,369 @@
 import sqlite3
 import os
+import queue
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional
 
 # Database file path - store in backend directory
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'sentio.db')
 
+# Maximum number of idle connections kept open for reuse
+POOL_SIZE = int(os.getenv("SENTIO_DB_POOL_SIZE", "4"))
+
+# Skip fsyncs entirely when the database only holds disposable fixture/demo data
+FIXTURE_FAST = os.getenv("SENTIO_FIXTURE_FAST") == "1"
+
 def get_db_path() -> str:
     """Get the absolute path to the database file."""
     return os.path.abspath(DB_PATH)
 
-@contextmanager
-def get_connection() -> Generator[sqlite3.Connection, None, None]:
-    """Context manager for database connections."""
-    conn = sqlite3.connect(get_db_path())
+def _connect(path: str) -> sqlite3.Connection:
+    """Open a new connection and apply all per-connection settings once."""
+    # Pooled connections are handed to whichever thread requests them next
+    # Larger statement cache so factory and router INSERTs stay prepared
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row  # Return rows as dictionaries
     conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key support
+    # Per-connection tuning (journal_mode=WAL is persistent and set in init_database).
+    # synchronous=NORMAL is crash-safe in WAL mode and avoids an fsync per commit.
+    conn.execute("PRAGMA synchronous = OFF" if FIXTURE_FAST else "PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+    conn.execute("PRAGMA mmap_size = 10737418240")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    # Keep dirty pages in memory until commit instead of spilling mid-transaction
+    conn.execute("PRAGMA cache_spill = OFF")
+    return conn
+
+class _ConnectionPool:
+    """
+    Keeps up to `maxsize` idle connections to one database file for reuse.
+
+    Reusing connections preserves SQLite's page cache and statement cache
+    between requests. Acquiring never blocks: if no idle connection is
+    available a new one is opened, and connections returned to a full pool
+    are closed.
+    """
+
+    def __init__(self, path: str, maxsize: int):
+        self.path = path
+        self._idle: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize)
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return _connect(self.path)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+_pool: Optional[_ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> _ConnectionPool:
+    """Return the pool for the current database path, replacing it if the path changed."""
+    global _pool
+    path = get_db_path()
+    pool = _pool
+    if pool is None or pool.path != path:
+        with _pool_lock:
+            if _pool is None or _pool.path != path:
+                if _pool is not None:
+                    _pool.close()
+                _pool = _ConnectionPool(path, POOL_SIZE)
+            pool = _pool
+    return pool
+
+def close_connections() -> None:
+    """Close all idle pooled connections (e.g. on shutdown or before deleting the file)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+@contextmanager
+def get_connection() -> Generator[sqlite3.Connection, None, None]:
+    """Context manager for pooled database connections."""
+    pool = _get_pool()
+    conn = pool.acquire()
     try:
         yield conn
         conn.commit()
-    except Exception:
-        conn.rollback()
+    except BaseException:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            # Connection is unusable; drop it instead of returning it to the pool
+            conn.close()
+            raise
+        pool.release(conn)
         raise
-    finally:
-        conn.close()
+    pool.release(conn)
+
+# Schema DDL, run as a single script by init_database().
+# {without_rowid} marks tables whose rows are stored directly in the primary key B-tree.
+_SCHEMA_DDL = """
+BEGIN;
+
+    -- Create projects table
+    CREATE TABLE IF NOT EXISTS projects (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        icon TEXT DEFAULT '🚀',
+        goal TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ){without_rowid};
+
+    -- Create chat_sessions table
+    CREATE TABLE IF NOT EXISTS chat_sessions (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        title TEXT DEFAULT 'New Chat',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+
+    -- Create messages table (rowid table: WITHOUT ROWID suits small rows, message content can be long)
+    CREATE TABLE IF NOT EXISTS messages (
+        id TEXT PRIMARY KEY,
+        session_id TEXT NOT NULL,
+        role TEXT NOT NULL CHECK(role IN ('user', 'assistant')),
+        content TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (session_id) REFERENCES chat_sessions(id) ON DELETE CASCADE
+    );
+
+    -- Create documents table for tracking uploaded files
+    CREATE TABLE IF NOT EXISTS documents (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        filename TEXT NOT NULL,
+        file_size INTEGER,
+        content_type TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
 
-def init_database():
-    """Initialize the database schema."""
+    -- Create workflow_state table - tracks workflow progress per project (one row per project)
+    CREATE TABLE IF NOT EXISTS workflow_state (
+        project_id TEXT PRIMARY KEY,
+        current_stage TEXT NOT NULL DEFAULT 'define_indicators',
+        stage_data TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+
+    -- Create indicators table - success indicators (KPIs) for each project
+    CREATE TABLE IF NOT EXISTS indicators (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        description TEXT,
+        target_value TEXT,
+        current_value TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    ){without_rowid};
+
+    -- Create assessment_rounds table - each periodic assessment session
+    CREATE TABLE IF NOT EXISTS assessment_rounds (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        title TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+
+    -- Create assessments table - individual ratings within a round
+    CREATE TABLE IF NOT EXISTS assessments (
+        id TEXT PRIMARY KEY,
+        round_id TEXT NOT NULL,
+        indicator_id TEXT NOT NULL,
+        assessment_type TEXT NOT NULL CHECK(assessment_type IN ('self_rating', 'ai_interview')),
+        rating INTEGER CHECK(rating >= 1 AND rating <= 10),
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (round_id) REFERENCES assessment_rounds(id) ON DELETE CASCADE,
+        FOREIGN KEY (indicator_id) REFERENCES indicators(id) ON DELETE CASCADE
+    ){without_rowid};
+
+    -- Create action_items table - replaces mock data
+    CREATE TABLE IF NOT EXISTS action_items (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        assignee TEXT,
+        due_date TEXT,
+        priority TEXT DEFAULT 'medium',
+        status TEXT DEFAULT 'open',
+        source TEXT DEFAULT 'ai_generated',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    ){without_rowid};
+
+    -- Create stakeholder_groups table - stakeholder management
+    CREATE TABLE IF NOT EXISTS stakeholder_groups (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        group_type TEXT NOT NULL CHECK(group_type IN ('fuehrungskraefte', 'multiplikatoren', 'mitarbeitende')),
+        name TEXT,
+        power_level TEXT NOT NULL CHECK(power_level IN ('high', 'low')),
+        interest_level TEXT NOT NULL CHECK(interest_level IN ('high', 'low')),
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    ){without_rowid};
+
+    -- Create stakeholder_assessments table - assessments for stakeholder groups
+    CREATE TABLE IF NOT EXISTS stakeholder_assessments (
+        id TEXT PRIMARY KEY,
+        stakeholder_group_id TEXT NOT NULL,
+        indicator_key TEXT NOT NULL,
+        rating INTEGER CHECK(rating >= 1 AND rating <= 10),
+        notes TEXT,
+        assessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (stakeholder_group_id) REFERENCES stakeholder_groups(id) ON DELETE CASCADE
+    ){without_rowid};
+
+    -- Create surveys table - tracks generated surveys
+    CREATE TABLE IF NOT EXISTS surveys (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        stakeholder_group_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        file_path TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+        FOREIGN KEY (stakeholder_group_id) REFERENCES stakeholder_groups(id) ON DELETE CASCADE
+    ){without_rowid};
+
+    -- Create recommendations table - AI-generated action recommendations
+    CREATE TABLE IF NOT EXISTS recommendations (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        recommendation_type TEXT NOT NULL CHECK(recommendation_type IN ('habit', 'communication', 'workshop', 'process', 'campaign')),
+        priority TEXT NOT NULL DEFAULT 'medium' CHECK(priority IN ('high', 'medium', 'low')),
+        status TEXT NOT NULL DEFAULT 'pending_approval' CHECK(status IN ('pending_approval', 'approved', 'rejected', 'started', 'completed')),
+        affected_groups TEXT,
+        steps TEXT,
+        rejection_reason TEXT,
+        parent_id TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        approved_at TIMESTAMP,
+        started_at TIMESTAMP,
+        completed_at TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+        FOREIGN KEY (parent_id) REFERENCES recommendations(id) ON DELETE SET NULL
+    );
+
+    -- Create insights table - AI-generated observations
+    CREATE TABLE IF NOT EXISTS insights (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        insight_type TEXT NOT NULL CHECK(insight_type IN ('trend', 'opportunity', 'warning', 'success', 'pattern')),
+        priority TEXT NOT NULL DEFAULT 'medium' CHECK(priority IN ('high', 'medium', 'low')),
+        trigger_type TEXT NOT NULL CHECK(trigger_type IN ('manual', 'impulse_completed', 'recommendation_completed')),
+        trigger_entity_id TEXT,
+        related_groups TEXT,
+        related_recommendations TEXT,
+        action_suggestions TEXT,
+        is_dismissed BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+
+    -- Create indexes for better query performance
+    CREATE INDEX IF NOT EXISTS idx_sessions_project_id ON chat_sessions(project_id);
+    CREATE INDEX IF NOT EXISTS idx_messages_session_created ON messages(session_id, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_documents_project_id ON documents(project_id);
+    CREATE INDEX IF NOT EXISTS idx_indicators_project_id ON indicators(project_id);
+    CREATE INDEX IF NOT EXISTS idx_assessment_rounds_project_id ON assessment_rounds(project_id);
+    CREATE INDEX IF NOT EXISTS idx_assessments_round_indicator ON assessments(round_id, indicator_id);
+    CREATE INDEX IF NOT EXISTS idx_assessments_indicator_id ON assessments(indicator_id);
+    CREATE INDEX IF NOT EXISTS idx_action_items_project_id ON action_items(project_id);
+    CREATE INDEX IF NOT EXISTS idx_stakeholder_groups_project_id ON stakeholder_groups(project_id);
+    CREATE INDEX IF NOT EXISTS idx_stakeholder_assessments_group_assessed ON stakeholder_assessments(stakeholder_group_id, assessed_at);
+    CREATE INDEX IF NOT EXISTS idx_stakeholder_assessments_group_indicator ON stakeholder_assessments(stakeholder_group_id, indicator_key);
+    CREATE INDEX IF NOT EXISTS idx_surveys_project_id ON surveys(project_id);
+    CREATE INDEX IF NOT EXISTS idx_surveys_stakeholder_group_id ON surveys(stakeholder_group_id);
+    CREATE INDEX IF NOT EXISTS idx_recommendations_project_id ON recommendations(project_id);
+    CREATE INDEX IF NOT EXISTS idx_recommendations_status ON recommendations(status);
+    CREATE INDEX IF NOT EXISTS idx_insights_project_id ON insights(project_id);
+    CREATE INDEX IF NOT EXISTS idx_insights_created_at ON insights(created_at);
+
+    -- Single-column indexes superseded by the composite indexes above
+    DROP INDEX IF EXISTS idx_messages_session_id;
+    DROP INDEX IF EXISTS idx_assessments_round_id;
+    DROP INDEX IF EXISTS idx_stakeholder_assessments_group_id;
+    DROP INDEX IF EXISTS idx_workflow_state_project_id;
+
+COMMIT;
+"""
+
+# Rebuilds a workflow_state table from before project_id became its primary key
+_MIGRATE_WORKFLOW_STATE_DDL = """
+BEGIN;
+
+    CREATE TABLE workflow_state_new (
+        project_id TEXT PRIMARY KEY,
+        current_stage TEXT NOT NULL DEFAULT 'define_indicators',
+        stage_data TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+
+    INSERT INTO workflow_state_new (project_id, current_stage, stage_data, created_at, updated_at)
+    SELECT project_id, current_stage, stage_data, created_at, updated_at FROM workflow_state;
+
+    DROP TABLE workflow_state;
+    ALTER TABLE workflow_state_new RENAME TO workflow_state;
+
+COMMIT;
+"""
+
+def init_database(without_rowid: bool = True):
+    """
+    Initialize the database schema.
+
+    Args:
+        without_rowid: Create the high-traffic TEXT-keyed tables as WITHOUT ROWID.
+            Only affects tables that do not exist yet.
+    """
     with get_connection() as conn:
-        cursor = conn.cursor()
-
-        # Create projects table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS projects (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                icon TEXT DEFAULT '🚀',
-                goal TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create chat_sessions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chat_sessions (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                title TEXT DEFAULT 'New Chat',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create messages table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS messages (
-                id TEXT PRIMARY KEY,
-                session_id TEXT NOT NULL,
-                role TEXT NOT NULL CHECK(role IN ('user', 'assistant')),
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (session_id) REFERENCES chat_sessions(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create documents table for tracking uploaded files
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS documents (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                filename TEXT NOT NULL,
-                file_size INTEGER,
-                content_type TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create workflow_state table - tracks workflow progress per project
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS workflow_state (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL UNIQUE,
-                current_stage TEXT NOT NULL DEFAULT 'define_indicators',
-                stage_data TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create indicators table - success indicators (KPIs) for each project
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS indicators (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT,
-                target_value TEXT,
-                current_value TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create assessment_rounds table - each periodic assessment session
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assessment_rounds (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                title TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create assessments table - individual ratings within a round
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assessments (
-                id TEXT PRIMARY KEY,
-                round_id TEXT NOT NULL,
-                indicator_id TEXT NOT NULL,
-                assessment_type TEXT NOT NULL CHECK(assessment_type IN ('self_rating', 'ai_interview')),
-                rating INTEGER CHECK(rating >= 1 AND rating <= 10),
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (round_id) REFERENCES assessment_rounds(id) ON DELETE CASCADE,
-                FOREIGN KEY (indicator_id) REFERENCES indicators(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create action_items table - replaces mock data
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS action_items (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                assignee TEXT,
-                due_date TEXT,
-                priority TEXT DEFAULT 'medium',
-                status TEXT DEFAULT 'open',
-                source TEXT DEFAULT 'ai_generated',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create stakeholder_groups table - stakeholder management
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS stakeholder_groups (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                group_type TEXT NOT NULL CHECK(group_type IN ('fuehrungskraefte', 'multiplikatoren', 'mitarbeitende')),
-                name TEXT,
-                power_level TEXT NOT NULL CHECK(power_level IN ('high', 'low')),
-                interest_level TEXT NOT NULL CHECK(interest_level IN ('high', 'low')),
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create stakeholder_assessments table - assessments for stakeholder groups
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS stakeholder_assessments (
-                id TEXT PRIMARY KEY,
-                stakeholder_group_id TEXT NOT NULL,
-                indicator_key TEXT NOT NULL,
-                rating INTEGER CHECK(rating >= 1 AND rating <= 10),
-                notes TEXT,
-                assessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (stakeholder_group_id) REFERENCES stakeholder_groups(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create surveys table - tracks generated surveys
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS surveys (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                stakeholder_group_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                file_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
-                FOREIGN KEY (stakeholder_group_id) REFERENCES stakeholder_groups(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create recommendations table - AI-generated action recommendations
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recommendations (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                recommendation_type TEXT NOT NULL CHECK(recommendation_type IN ('habit', 'communication', 'workshop', 'process', 'campaign')),
-                priority TEXT NOT NULL DEFAULT 'medium' CHECK(priority IN ('high', 'medium', 'low')),
-                status TEXT NOT NULL DEFAULT 'pending_approval' CHECK(status IN ('pending_approval', 'approved', 'rejected', 'started', 'completed')),
-                affected_groups TEXT,
-                steps TEXT,
-                rejection_reason TEXT,
-                parent_id TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                approved_at TIMESTAMP,
-                started_at TIMESTAMP,
-                completed_at TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
-                FOREIGN KEY (parent_id) REFERENCES recommendations(id) ON DELETE SET NULL
-            )
-        """)
-
-        # Create insights table - AI-generated observations
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS insights (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                insight_type TEXT NOT NULL CHECK(insight_type IN ('trend', 'opportunity', 'warning', 'success', 'pattern')),
-                priority TEXT NOT NULL DEFAULT 'medium' CHECK(priority IN ('high', 'medium', 'low')),
-                trigger_type TEXT NOT NULL CHECK(trigger_type IN ('manual', 'impulse_completed', 'recommendation_completed')),
-                trigger_entity_id TEXT,
-                related_groups TEXT,
-                related_recommendations TEXT,
-                action_suggestions TEXT,
-                is_dismissed BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Create indexes for better query performance
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_sessions_project_id
-            ON chat_sessions(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_messages_session_id
-            ON messages(session_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_documents_project_id
-            ON documents(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_workflow_state_project_id
-            ON workflow_state(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_indicators_project_id
-            ON indicators(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_assessment_rounds_project_id
-            ON assessment_rounds(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_assessments_round_id
-            ON assessments(round_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_assessments_indicator_id
-            ON assessments(indicator_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_action_items_project_id
-            ON action_items(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_stakeholder_groups_project_id
-            ON stakeholder_groups(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_stakeholder_assessments_group_id
-            ON stakeholder_assessments(stakeholder_group_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_surveys_project_id
-            ON surveys(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_surveys_stakeholder_group_id
-            ON surveys(stakeholder_group_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_recommendations_project_id
-            ON recommendations(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_recommendations_status
-            ON recommendations(status)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_insights_project_id
-            ON insights(project_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_insights_created_at
-            ON insights(created_at)
-        """)
+        # Write-ahead logging lets readers proceed during writes and makes
+        # commits cheaper. The mode is stored in the database file, so it only
+        # needs to be set once.
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA wal_autocheckpoint = 1000")
 
-        conn.commit()
+        conn.executescript(_SCHEMA_DDL.format(without_rowid=" WITHOUT ROWID" if without_rowid else ""))
+
+        workflow_columns = {row["name"] for row in conn.execute("PRAGMA table_info(workflow_state)")}
+        if "id" in workflow_columns:
+            conn.executescript(_MIGRATE_WORKFLOW_STATE_DDL)
 
 def dict_from_row(row: sqlite3.Row) -> dict:
     """Convert a sqlite3.Row to a dictionary."""
@@ -3,8 +3,10 @@ Base factory class with common functionality for all entity factories.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, TypeVar
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
 from datetime import datetime, timedelta
+import os
 import uuid
 import sqlite3
 
@@ -17,6 +19,12 @@ class BaseFactory(ABC, Generic[T]):
     # Shared sequence counters across all factories
     _sequence_counters: Dict[str, int] = {}
 
+    # Cached "now" timestamp while inside frozen_clock()
+    _now: Optional[str] = None
+
+    # Entity dict keys in the parameter order of _insert_sql()
+    _COLUMNS: Tuple[str, ...] = ()
+
     @classmethod
     def reset_sequences(cls) -> None:
         """Reset all sequence counters. Useful between test runs."""
@@ -25,28 +33,84 @@ class BaseFactory(ABC, Generic[T]):
     @classmethod
     def next_sequence(cls, name: str) -> int:
         """Get the next sequence number for a named counter."""
-        if name not in cls._sequence_counters:
-            cls._sequence_counters[name] = 0
-        cls._sequence_counters[name] += 1
-        return cls._sequence_counters[name]
+        value = cls._sequence_counters.get(name, 0) + 1
+        cls._sequence_counters[name] = value
+        return value
 
     @classmethod
     def generate_id(cls) -> str:
         """Generate a new UUID."""
         return str(uuid.uuid4())
 
+    @classmethod
+    def generate_ids(cls, n: int) -> List[str]:
+        """Generate n UUID4 strings from a single os.urandom call."""
+        raw = bytearray(os.urandom(16 * n))
+        # Set the version (4) and RFC 4122 variant bits of every UUID at once
+        raw[6::16] = bytes(b & 0x0F | 0x40 for b in raw[6::16])
+        raw[8::16] = bytes(b & 0x3F | 0x80 for b in raw[8::16])
+        h = raw.hex()
+        return [
+            f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+            for i in range(0, 32 * n, 32)
+        ]
+
     @classmethod
     def generate_timestamp(cls, days_ago: int = 0, hours_ago: int = 0, minutes_ago: int = 0) -> str:
         """Generate an ISO timestamp, optionally offset from now."""
+        if cls._now is not None and not (days_ago or hours_ago or minutes_ago):
+            return cls._now
         dt = datetime.utcnow() - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
         return dt.isoformat()
 
+    @classmethod
+    @contextmanager
+    def frozen_clock(cls) -> Iterator[str]:
+        """Reuse a single "now" timestamp for all unoffset generate_timestamp() calls."""
+        previous = cls._now
+        cls._now = datetime.utcnow().isoformat()
+        try:
+            yield cls._now
+        finally:
+            cls._now = previous
+
+    @classmethod
+    @contextmanager
+    def bulk_insert_context(cls, conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+        """
+        Defer foreign key checks to commit time for a block of bulk INSERTs.
+
+        Constraints are still enforced, but verified once when the surrounding
+        transaction commits instead of row by row. SQLite resets the pragma
+        itself at COMMIT/ROLLBACK; switching it off earlier would let pending
+        violations through.
+        """
+        conn.execute("PRAGMA defer_foreign_keys = ON")
+        yield conn
+
     @classmethod
     def generate_timestamp_from_base(cls, base_date: datetime, days_offset: int = 0) -> str:
         """Generate an ISO timestamp relative to a base date."""
         dt = base_date + timedelta(days=days_offset)
         return dt.isoformat()
 
+    @classmethod
+    def day_stamper(cls, base_date: Optional[datetime] = None) -> Callable[[int], str]:
+        """
+        Return a function mapping a whole-day offset from base_date (default: now)
+        to its ISO timestamp. Each distinct offset is formatted only once.
+        """
+        base = base_date or datetime.utcnow()
+        stamps: Dict[int, str] = {}
+
+        def stamp(days_offset: int) -> str:
+            value = stamps.get(days_offset)
+            if value is None:
+                value = stamps[days_offset] = (base + timedelta(days=days_offset)).isoformat()
+            return value
+
+        return stamp
+
     @classmethod
     def get_base_date(cls, days_ago: int) -> datetime:
         """Get a base datetime for relative calculations."""
@@ -61,6 +125,11 @@ class BaseFactory(ABC, Generic[T]):
         """
         pass
 
+    @classmethod
+    def build_batch(cls, count: int, **kwargs) -> List[Dict[str, Any]]:
+        """Build multiple entity dicts without persisting."""
+        return [cls.build(id=entity_id, **kwargs) for entity_id in cls.generate_ids(count)]
+
     @classmethod
     @abstractmethod
     def create(cls, conn: sqlite3.Connection, **kwargs) -> Dict[str, Any]:
@@ -70,7 +139,98 @@ class BaseFactory(ABC, Generic[T]):
         """
         pass
 
+    @classmethod
+    def _insert_sql(cls) -> Optional[str]:
+        """
+        INSERT statement used by create_batch, or None if the factory
+        must persist entities one at a time through create().
+        Factories returning a statement must accept an `id` kwarg in build()
+        and declare _COLUMNS in the statement's parameter order.
+        """
+        return None
+
+    @classmethod
+    def _row_tuple(cls, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Parameters for _insert_sql() from a built entity dict."""
+        return tuple(data[column] for column in cls._COLUMNS)
+
+    @classmethod
+    @contextmanager
+    def deferred_indexes(cls, conn: sqlite3.Connection, table: str) -> Iterator[None]:
+        """
+        Drop the explicitly created indexes on a table for the duration of a
+        bulk load and rebuild them afterwards.
+
+        The drop, the load and the rebuild run under a savepoint. If no
+        transaction is open yet, one is started first; it stays open for the
+        caller to commit. If the block raises, the work is rolled back to the
+        savepoint, which restores the indexes, and the error is re-raised.
+
+        Primary key and UNIQUE autoindexes have no SQL in sqlite_master and
+        are left in place.
+        """
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,)
+        ).fetchall()
+        if not indexes:
+            yield
+            return
+
+        if not conn.in_transaction:
+            # Otherwise the DROP INDEX statements would be autocommitted
+            conn.execute("BEGIN")
+        conn.execute("SAVEPOINT deferred_indexes")
+        try:
+            for name, _ in indexes:
+                conn.execute(f'DROP INDEX "{name}"')
+            yield
+            for _, sql in indexes:
+                conn.execute(sql)
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK TO deferred_indexes")
+                conn.execute("RELEASE deferred_indexes")
+            raise
+        conn.execute("RELEASE deferred_indexes")
+
+    @classmethod
+    def insert_multi_row(
+        cls,
+        conn: sqlite3.Connection,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[Tuple[Any, ...]],
+        chunk_size: int = 100,
+    ) -> None:
+        """
+        Insert rows using multi-row VALUES statements of up to chunk_size rows.
+
+        table and columns are interpolated into the SQL and must be trusted
+        identifiers. chunk_size * len(columns) must stay below SQLite's bound
+        parameter limit (999 on older builds).
+        """
+        placeholder = "(" + ", ".join("?" * len(columns)) + ")"
+        prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        full_sql = prefix + ", ".join([placeholder] * chunk_size)
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            # Full chunks reuse one cached statement; only the tail differs
+            sql = full_sql if len(chunk) == chunk_size else prefix + ", ".join([placeholder] * len(chunk))
+            conn.execute(sql, [value for row in chunk for value in row])
+
     @classmethod
     def create_batch(cls, conn: sqlite3.Connection, count: int, **kwargs) -> List[Dict[str, Any]]:
         """Create multiple entities with the same base kwargs."""
-        return [cls.create(conn, **kwargs) for _ in range(count)]
+        sql = cls._insert_sql()
+        if sql is None:
+            return [cls.create(conn, **kwargs) for _ in range(count)]
+
+        # Build everything in memory, then insert with a single executemany.
+        # The caller's connection context owns the surrounding transaction.
+        with cls.frozen_clock():
+            entities = cls.build_batch(count, **kwargs)
+        with cls.bulk_insert_context(conn):
+            conn.executemany(sql, [cls._row_tuple(data) for data in entities])
+        return entities
@@ -4,7 +4,7 @@ Project factory for generating test project data.
 
 import random
 import sqlite3
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from .base import BaseFactory
@@ -36,10 +36,25 @@ PROJECT_GOALS = [
 # Project icons
 PROJECT_ICONS = ["🚀", "💡", "🎯", "📊", "🔄", "⚡", "🌟", "🏗️"]
 
+_PROJECT_COLUMNS = ("id", "name", "icon", "goal", "created_at", "updated_at")
+
+# INSERT statements reused across calls so SQLite's statement cache hits
+_INSERT_PROJECT_SQL = """
+    INSERT INTO projects (id, name, icon, goal, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_WORKFLOW_SQL = """
+    INSERT INTO workflow_state (project_id, current_stage, created_at, updated_at)
+    VALUES (?, ?, ?, ?)
+"""
+
 
 class ProjectFactory(BaseFactory):
     """Factory for creating project entities."""
 
+    _COLUMNS = _PROJECT_COLUMNS
+
     @classmethod
     def build(
         cls,
@@ -47,20 +62,47 @@ class ProjectFactory(BaseFactory):
         icon: Optional[str] = None,
         goal: Optional[str] = None,
         created_at: Optional[str] = None,
+        days_ago: Optional[int] = None,
+        id: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Build a project dict without persisting."""
         seq = cls.next_sequence("project")
 
+        # Handle days_ago for created_at
+        if days_ago is not None and created_at is None:
+            created_at = cls.generate_timestamp(days_ago=days_ago)
+
+        created_at = created_at or cls.generate_timestamp()
+
         return {
-            "id": cls.generate_id(),
+            "id": id or cls.generate_id(),
             "name": name or random.choice(PROJECT_NAMES),
             "icon": icon or random.choice(PROJECT_ICONS),
             "goal": goal or random.choice(PROJECT_GOALS),
-            "created_at": created_at or cls.generate_timestamp(),
-            "updated_at": created_at or cls.generate_timestamp(),
+            "created_at": created_at,
+            "updated_at": created_at,
         }
 
+    @classmethod
+    def build_batch(
+        cls,
+        count: int,
+        name: Optional[str] = None,
+        icon: Optional[str] = None,
+        goal: Optional[str] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Build multiple project dicts, drawing all random choices up front."""
+        names = [name] * count if name else random.choices(PROJECT_NAMES, k=count)
+        icons = [icon] * count if icon else random.choices(PROJECT_ICONS, k=count)
+        goals = [goal] * count if goal else random.choices(PROJECT_GOALS, k=count)
+
+        return [
+            cls.build(id=entity_id, name=n, icon=i, goal=g, **kwargs)
+            for entity_id, n, i, g in zip(cls.generate_ids(count), names, icons, goals)
+        ]
+
     @classmethod
     def create(
         cls,
@@ -73,36 +115,23 @@ class ProjectFactory(BaseFactory):
         **kwargs
     ) -> Dict[str, Any]:
         """Create and persist a project."""
-        # Handle days_ago for created_at
-        if days_ago is not None and created_at is None:
-            created_at = cls.generate_timestamp(days_ago=days_ago)
-
         data = cls.build(
             name=name,
             icon=icon,
             goal=goal,
             created_at=created_at,
+            days_ago=days_ago,
             **kwargs
         )
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO projects (id, name, icon, goal, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["name"],
-                data["icon"],
-                data["goal"],
-                data["created_at"],
-                data["updated_at"],
-            )
-        )
+        conn.execute(_INSERT_PROJECT_SQL, cls._row_tuple(data))
 
         return data
 
+    @classmethod
+    def _insert_sql(cls) -> str:
+        return _INSERT_PROJECT_SQL
+
     @classmethod
     def create_with_workflow_state(
         cls,
@@ -111,22 +140,42 @@ class ProjectFactory(BaseFactory):
         **kwargs
     ) -> Dict[str, Any]:
         """Create a project with an initialized workflow state."""
-        project = cls.create(conn, **kwargs)
-
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO workflow_state (id, project_id, current_stage, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+        project = cls.build(**kwargs)
+
+        # Both rows are written inside the caller's transaction
+        conn.execute(_INSERT_PROJECT_SQL, cls._row_tuple(project))
+        conn.execute(
+            _INSERT_WORKFLOW_SQL,
             (
-                cls.generate_id(),
                 project["id"],
                 current_stage,
                 project["created_at"],
-                project["created_at"],
+                project["updated_at"],
             )
         )
 
         project["workflow_stage"] = current_stage
         return project
+
+    @classmethod
+    def create_batch_with_workflow_state(
+        cls,
+        conn: sqlite3.Connection,
+        count: int,
+        current_stage: str = "define_indicators",
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Create multiple projects and their workflow states with one executemany per table."""
+        projects = cls.create_batch(conn, count, **kwargs)
+
+        conn.executemany(
+            _INSERT_WORKFLOW_SQL,
+            [
+                (project["id"], current_stage, project["created_at"], project["created_at"])
+                for project in projects
+            ]
+        )
+
+        for project in projects:
+            project["workflow_stage"] = current_stage
+        return projects
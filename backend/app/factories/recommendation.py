@@ -3,13 +3,18 @@ Recommendation factory for generating test recommendation data.
 """
 
 import random
-import json
 import sqlite3
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 from .base import BaseFactory
-from ..prompts import load_constants
+from ..prompts import constants_cache, load_constants
+
+
+def _dumps(value: Any) -> str:
+    """Compact JSON text for the affected_groups/steps columns."""
+    return orjson.dumps(value).decode()
 
 
 def get_recommendation_templates() -> Dict[str, List[Dict]]:
@@ -17,14 +22,59 @@ def get_recommendation_templates() -> Dict[str, List[Dict]]:
     return load_constants("recommendation_templates")
 
 
+@constants_cache
+def get_recommendation_types() -> Tuple[str, ...]:
+    """Recommendation types that have templates, for random selection."""
+    return tuple(get_recommendation_templates().keys())
+
+
 def get_rejection_reasons() -> List[str]:
     """Load localized rejection reasons."""
     return load_constants("rejection_reasons")
 
 
+@constants_cache
+def get_template_steps_json() -> Dict[Tuple[str, ...], str]:
+    """
+    Serialized steps of every template, keyed by the steps as a tuple.
+
+    Template steps are encoded once here instead of for every recommendation.
+    Steps passed in by callers hit the same entry when they match a template.
+    """
+    return {
+        tuple(template["steps"]): _dumps(template["steps"])
+        for templates in get_recommendation_templates().values()
+        for template in templates
+    }
+
+
+_PRIORITIES = ("high", "medium", "low")
+
+_DEFAULT_AFFECTED_GROUPS = ["multiplikatoren"]
+_DEFAULT_AFFECTED_GROUPS_JSON = _dumps(_DEFAULT_AFFECTED_GROUPS)
+
+
+# Column order shared by the INSERT statement and _build_values()
+_RECOMMENDATION_COLUMNS = (
+    "id", "project_id", "title", "description", "recommendation_type", "priority", "status",
+    "affected_groups", "steps", "rejection_reason", "parent_id", "created_at",
+    "approved_at", "started_at", "completed_at",
+)
+
+_INSERT_RECOMMENDATION_SQL = """
+    INSERT INTO recommendations
+    (id, project_id, title, description, recommendation_type, priority, status,
+     affected_groups, steps, rejection_reason, parent_id, created_at,
+     approved_at, started_at, completed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class RecommendationFactory(BaseFactory):
     """Factory for creating recommendation entities."""
 
+    _COLUMNS = _RECOMMENDATION_COLUMNS
+
     @classmethod
     def build(
         cls,
@@ -41,32 +91,97 @@ class RecommendationFactory(BaseFactory):
         approved_at: Optional[str] = None,
         started_at: Optional[str] = None,
         completed_at: Optional[str] = None,
+        id: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Build a recommendation dict without persisting."""
+        values = cls._build_values(
+            project_id,
+            title=title,
+            description=description,
+            recommendation_type=recommendation_type,
+            priority=priority,
+            status=status,
+            affected_groups=affected_groups,
+            steps=steps,
+            rejection_reason=rejection_reason,
+            created_at=created_at,
+            approved_at=approved_at,
+            started_at=started_at,
+            completed_at=completed_at,
+            id=id,
+        )
+        return dict(zip(_RECOMMENDATION_COLUMNS, values))
+
+    @classmethod
+    def build_batch(
+        cls,
+        count: int,
+        recommendation_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Build multiple recommendation dicts, drawing types and priorities up front."""
+        rec_types = [recommendation_type] * count if recommendation_type else random.choices(get_recommendation_types(), k=count)
+        priorities = [priority] * count if priority else random.choices(_PRIORITIES, k=count)
+
+        return [
+            cls.build(id=entity_id, recommendation_type=rec_type, priority=prio, **kwargs)
+            for entity_id, rec_type, prio in zip(cls.generate_ids(count), rec_types, priorities)
+        ]
+
+    @classmethod
+    def _build_values(
+        cls,
+        project_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        recommendation_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        status: Optional[str] = None,
+        affected_groups: Optional[List[str]] = None,
+        steps: Optional[List[str]] = None,
+        rejection_reason: Optional[str] = None,
+        created_at: Optional[str] = None,
+        approved_at: Optional[str] = None,
+        started_at: Optional[str] = None,
+        completed_at: Optional[str] = None,
+        id: Optional[str] = None,
+    ) -> Tuple[Any, ...]:
+        """Build a recommendation as a tuple of values in _RECOMMENDATION_COLUMNS order."""
         # Pick a random type and template if not specified
         recommendation_templates = get_recommendation_templates()
-        rec_type = recommendation_type or random.choice(list(recommendation_templates.keys()))
+        rec_type = recommendation_type or random.choice(get_recommendation_types())
         templates = recommendation_templates.get(rec_type, recommendation_templates["habit"])
         template = random.choice(templates)
 
-        return {
-            "id": cls.generate_id(),
-            "project_id": project_id,
-            "title": title or template["title"],
-            "description": description or template["description"],
-            "recommendation_type": rec_type,
-            "priority": priority or random.choice(["high", "medium", "low"]),
-            "status": status or "pending_approval",
-            "affected_groups": affected_groups or ["multiplikatoren"],
-            "steps": steps or template["steps"],
-            "rejection_reason": rejection_reason,
-            "parent_id": None,
-            "created_at": created_at or cls.generate_timestamp(),
-            "approved_at": approved_at,
-            "started_at": started_at,
-            "completed_at": completed_at,
-        }
+        return (
+            id or cls.generate_id(),
+            project_id,
+            title or template["title"],
+            description or template["description"],
+            rec_type,
+            priority or random.choice(_PRIORITIES),
+            status or "pending_approval",
+            affected_groups or list(_DEFAULT_AFFECTED_GROUPS),
+            steps or template["steps"],
+            rejection_reason,
+            None,
+            created_at or cls.generate_timestamp(),
+            approved_at,
+            started_at,
+            completed_at,
+        )
+
+    @classmethod
+    def _encode_values(cls, values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """INSERT parameters from _build_values() output, with list columns JSON-encoded."""
+        affected_groups = values[7]
+        steps = values[8]
+        return values[:7] + (
+            _DEFAULT_AFFECTED_GROUPS_JSON if affected_groups == _DEFAULT_AFFECTED_GROUPS else _dumps(affected_groups),
+            get_template_steps_json().get(tuple(steps)) or _dumps(steps),
+        ) + values[9:]
 
     @classmethod
     def create(
@@ -105,36 +220,23 @@ class RecommendationFactory(BaseFactory):
             **kwargs
         )
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO recommendations
-            (id, project_id, title, description, recommendation_type, priority, status,
-             affected_groups, steps, rejection_reason, parent_id, created_at,
-             approved_at, started_at, completed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["project_id"],
-                data["title"],
-                data["description"],
-                data["recommendation_type"],
-                data["priority"],
-                data["status"],
-                json.dumps(data["affected_groups"]),
-                json.dumps(data["steps"]),
-                data["rejection_reason"],
-                data["parent_id"],
-                data["created_at"],
-                data["approved_at"],
-                data["started_at"],
-                data["completed_at"],
-            )
-        )
+        conn.execute(_INSERT_RECOMMENDATION_SQL, cls._row_tuple(data))
 
         return data
 
+    @classmethod
+    def _insert_sql(cls) -> str:
+        return _INSERT_RECOMMENDATION_SQL
+
+    @classmethod
+    def _row_tuple(cls, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        return cls._encode_values(super()._row_tuple(data))
+
+    @classmethod
+    def create_many(cls, conn: sqlite3.Connection, rows: List[Tuple[Any, ...]]) -> None:
+        """Persist _encode_values() rows with a single executemany."""
+        conn.executemany(_INSERT_RECOMMENDATION_SQL, rows)
+
     @classmethod
     def create_with_lifecycle(
         cls,
@@ -157,8 +259,30 @@ class RecommendationFactory(BaseFactory):
         Returns:
             Created recommendation with appropriate timestamps
         """
-        base_date = cls.get_base_date(days_ago)
-        created_at = cls.generate_timestamp_from_base(base_date, 0)
+        return cls.create(
+            conn,
+            project_id=project_id,
+            status=status,
+            **cls._lifecycle_fields(status, days_ago),
+            **kwargs
+        )
+
+    @classmethod
+    def _lifecycle_fields(
+        cls,
+        status: str,
+        days_ago: int,
+        stamp: Optional[Callable[[int], str]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Timestamps and rejection reason matching a recommendation status.
+
+        stamp maps a day offset from now to an ISO timestamp; pass a shared
+        BaseFactory.day_stamper() when building many recommendations.
+        """
+        if stamp is None:
+            stamp = cls.day_stamper()
+        created_at = stamp(-days_ago)
 
         approved_at = None
         started_at = None
@@ -171,30 +295,26 @@ class RecommendationFactory(BaseFactory):
 
         elif status == "approved":
             # Approved after 1-2 days
-            approved_at = cls.generate_timestamp_from_base(base_date, random.randint(1, 2))
+            approved_at = stamp(random.randint(1, 2) - days_ago)
 
         elif status == "started":
             # Approved after 1-2 days, started after 3-5 days
-            approved_at = cls.generate_timestamp_from_base(base_date, random.randint(1, 2))
-            started_at = cls.generate_timestamp_from_base(base_date, random.randint(3, 5))
+            approved_at = stamp(random.randint(1, 2) - days_ago)
+            started_at = stamp(random.randint(3, 5) - days_ago)
 
         elif status == "completed":
             # Full lifecycle
-            approved_at = cls.generate_timestamp_from_base(base_date, random.randint(1, 2))
-            started_at = cls.generate_timestamp_from_base(base_date, random.randint(3, 5))
-            completed_at = cls.generate_timestamp_from_base(base_date, random.randint(14, days_ago))
+            approved_at = stamp(random.randint(1, 2) - days_ago)
+            started_at = stamp(random.randint(3, 5) - days_ago)
+            completed_at = stamp(random.randint(14, days_ago) - days_ago)
 
-        return cls.create(
-            conn,
-            project_id=project_id,
-            status=status,
-            created_at=created_at,
-            approved_at=approved_at,
-            started_at=started_at,
-            completed_at=completed_at,
-            rejection_reason=rejection_reason,
-            **kwargs
-        )
+        return {
+            "created_at": created_at,
+            "approved_at": approved_at,
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "rejection_reason": rejection_reason,
+        }
 
     @classmethod
     def create_recommendation_set(
@@ -216,43 +336,94 @@ class RecommendationFactory(BaseFactory):
         Returns:
             List of created recommendations
         """
+        rows: List[Tuple[Any, ...]] = []
+        recommendations = cls._build_recommendation_set(project_id, status_counts, days_range, rows)
+        cls.create_many(conn, rows)
+        return recommendations
+
+    @classmethod
+    def create_for_projects(
+        cls,
+        conn: sqlite3.Connection,
+        project_ids: List[str],
+        status_counts: Dict[str, int],
+        days_range: tuple = (7, 60),
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Create a recommendation set for each of several projects.
+
+        All rows are written with a single executemany on the given connection.
+
+        Returns:
+            Dict mapping project ID -> list of created recommendations
+        """
+        rows: List[Tuple[Any, ...]] = []
+        stamp = cls.day_stamper()
+        created = {
+            project_id: cls._build_recommendation_set(project_id, status_counts, days_range, rows, stamp)
+            for project_id in project_ids
+        }
+        cls.create_many(conn, rows)
+        return created
+
+    @classmethod
+    def _build_recommendation_set(
+        cls,
+        project_id: str,
+        status_counts: Dict[str, int],
+        days_range: tuple,
+        rows: List[Tuple[Any, ...]],
+        stamp: Optional[Callable[[int], str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Build one project's recommendation set, appending its INSERT rows to rows."""
         recommendations = []
         min_days, max_days = days_range
 
-        # Track used templates to avoid duplicates
-        used_templates = set()
+        # Shuffled pools of unused templates per type, to avoid duplicates.
+        # Once every template has been used, all pools are refilled.
         recommendation_templates = get_recommendation_templates()
+        unused: Dict[str, List[Dict]] = {}
+        available_types: List[str] = []
+
+        # Draw creation ages and priorities for the whole set up front
+        total = sum(status_counts.values())
+        days_ago_draws = iter(random.choices(range(min_days, max_days + 1), k=total))
+        priority_draws = iter(random.choices(_PRIORITIES, k=total))
+        # All lifecycle timestamps are whole days away from one shared "now"
+        if stamp is None:
+            stamp = cls.day_stamper()
 
         for status, count in status_counts.items():
             for _ in range(count):
-                days_ago = random.randint(min_days, max_days)
-
-                # Try to pick unused template
-                rec_type = random.choice(list(recommendation_templates.keys()))
-                templates = recommendation_templates[rec_type]
-
-                # Find unused template
-                template = None
-                for t in templates:
-                    if t["title"] not in used_templates:
-                        template = t
-                        used_templates.add(t["title"])
-                        break
-
-                # If all used, pick random
-                if template is None:
-                    template = random.choice(templates)
-
-                rec = cls.create_with_lifecycle(
-                    conn,
-                    project_id=project_id,
+                days_ago = next(days_ago_draws)
+
+                if not available_types:
+                    for rec_type, templates in recommendation_templates.items():
+                        pool = list(templates)
+                        random.shuffle(pool)
+                        unused[rec_type] = pool
+                    available_types = [rec_type for rec_type, pool in unused.items() if pool]
+
+                index = random.randrange(len(available_types))
+                rec_type = available_types[index]
+                pool = unused[rec_type]
+                template = pool.pop()
+                if not pool:
+                    # Swap-remove the exhausted type
+                    available_types[index] = available_types[-1]
+                    available_types.pop()
+
+                values = cls._build_values(
+                    project_id,
                     status=status,
-                    days_ago=days_ago,
+                    priority=next(priority_draws),
                     title=template["title"],
                     description=template["description"],
                     recommendation_type=rec_type,
                     steps=template["steps"],
+                    **cls._lifecycle_fields(status, days_ago, stamp),
                 )
-                recommendations.append(rec)
+                rows.append(cls._encode_values(values))
+                recommendations.append(dict(zip(_RECOMMENDATION_COLUMNS, values)))
 
         return recommendations
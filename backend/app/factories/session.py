@@ -4,11 +4,19 @@ Session and Message factories for generating test chat data.
 
 import random
 import sqlite3
-from typing import Any, Dict, List, Optional
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 
 from .base import BaseFactory
-from ..prompts import load_constants
+from ..prompts import constants_cache, load_constants
+
+
+@lru_cache(maxsize=128)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO timestamp (accepting a trailing 'Z'), memoized per string."""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
 
 
 def get_session_titles() -> List[str]:
@@ -16,34 +24,58 @@ def get_session_titles() -> List[str]:
     return load_constants("session_titles")
 
 
-def get_conversations() -> List[List[tuple]]:
-    """Load localized conversations and convert to tuple format."""
+@constants_cache
+def get_conversations() -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+    """Load localized conversations and convert to (immutable) tuple format."""
     conversations_data = load_constants("conversations")
     result = []
     for conv in conversations_data:
-        messages = [(msg["role"], msg["content"]) for msg in conv]
+        messages = tuple((msg["role"], msg["content"]) for msg in conv)
         result.append(messages)
-    return result
+    return tuple(result)
+
+
+_INSERT_SESSION_SQL = """
+    INSERT INTO chat_sessions (id, project_id, title, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SESSION_COLUMNS = ("id", "project_id", "title", "created_at", "updated_at")
+
+_MESSAGE_COLUMNS = ("id", "session_id", "role", "content", "created_at")
+
+# Above this many messages, bulk seeding switches to multi-row VALUES inserts
+_MULTI_ROW_THRESHOLD = 200
+
+_INSERT_MESSAGE_SQL = """
+    INSERT INTO messages (id, session_id, role, content, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
 
 
 class SessionFactory(BaseFactory):
     """Factory for creating chat session entities."""
 
+    _COLUMNS = _SESSION_COLUMNS
+
     @classmethod
     def build(
         cls,
         project_id: str,
         title: Optional[str] = None,
         created_at: Optional[str] = None,
+        id: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Build a session dict without persisting."""
+        created_at = created_at or cls.generate_timestamp()
+
         return {
-            "id": cls.generate_id(),
+            "id": id or cls.generate_id(),
             "project_id": project_id,
             "title": title or random.choice(get_session_titles()),
-            "created_at": created_at or cls.generate_timestamp(),
-            "updated_at": created_at or cls.generate_timestamp(),
+            "created_at": created_at,
+            "updated_at": created_at,
         }
 
     @classmethod
@@ -63,27 +95,20 @@ class SessionFactory(BaseFactory):
             **kwargs
         )
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO chat_sessions (id, project_id, title, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["project_id"],
-                data["title"],
-                data["created_at"],
-                data["updated_at"],
-            )
-        )
+        conn.execute(_INSERT_SESSION_SQL, cls._row_tuple(data))
 
         return data
 
+    @classmethod
+    def _insert_sql(cls) -> str:
+        return _INSERT_SESSION_SQL
+
 
 class MessageFactory(BaseFactory):
     """Factory for creating chat message entities."""
 
+    _COLUMNS = _MESSAGE_COLUMNS
+
     @classmethod
     def build(
         cls,
@@ -91,11 +116,12 @@ class MessageFactory(BaseFactory):
         role: str,
         content: str,
         created_at: Optional[str] = None,
+        id: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Build a message dict without persisting."""
         return {
-            "id": cls.generate_id(),
+            "id": id or cls.generate_id(),
             "session_id": session_id,
             "role": role,
             "content": content,
@@ -121,31 +147,23 @@ class MessageFactory(BaseFactory):
             **kwargs
         )
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO messages (id, session_id, role, content, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["session_id"],
-                data["role"],
-                data["content"],
-                data["created_at"],
-            )
-        )
+        conn.execute(_INSERT_MESSAGE_SQL, cls._row_tuple(data))
 
         return data
 
+    @classmethod
+    def _insert_sql(cls) -> str:
+        return _INSERT_MESSAGE_SQL
+
     @classmethod
     def create_conversation(
         cls,
         conn: sqlite3.Connection,
         session_id: str,
-        conversation: Optional[List[tuple]] = None,
-        base_timestamp: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        conversation: Optional[Sequence[tuple]] = None,
+        base_timestamp: Optional[Union[str, datetime]] = None,
+        return_rows: bool = True,
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Create a full conversation in a session.
 
@@ -153,33 +171,51 @@ class MessageFactory(BaseFactory):
             conn: Database connection
             session_id: Session ID
             conversation: List of (role, content) tuples. If None, picks random.
-            base_timestamp: Base timestamp for first message
+            base_timestamp: Base timestamp for first message (ISO string or datetime)
+            return_rows: Set to False to skip building the message dicts
 
         Returns:
-            List of created messages
+            List of created messages, or None if return_rows is False
         """
         if conversation is None:
             conversation = random.choice(get_conversations())
 
         if base_timestamp is None:
             base_date = cls.get_base_date(random.randint(1, 30))
+        elif isinstance(base_timestamp, datetime):
+            base_date = base_timestamp
         else:
-            base_date = datetime.fromisoformat(base_timestamp.replace('Z', '+00:00'))
+            base_date = _parse_iso(base_timestamp)
+
+        rows = cls._conversation_rows(session_id, conversation, base_date)
+        conn.executemany(_INSERT_MESSAGE_SQL, rows)
 
-        messages = []
+        return cls._message_dicts(rows) if return_rows else None
+
+    @classmethod
+    def _conversation_rows(
+        cls,
+        session_id: str,
+        conversation: Sequence[tuple],
+        base_date: datetime,
+    ) -> List[Tuple[Any, ...]]:
+        """Build INSERT rows for a conversation starting at base_date."""
+        message_ids = cls.generate_ids(len(conversation))
+        # Add 1-5 minutes between messages
+        gaps = random.choices(range(1, 6), k=len(conversation))
+        rows = []
         for i, (role, content) in enumerate(conversation):
-            # Add 1-5 minutes between messages
-            message_time = base_date + timedelta(minutes=i * random.randint(1, 5))
-            msg = cls.create(
-                conn,
-                session_id=session_id,
-                role=role,
-                content=content,
-                created_at=message_time.isoformat(),
-            )
-            messages.append(msg)
-
-        return messages
+            message_time = base_date + timedelta(minutes=i * gaps[i])
+            rows.append((message_ids[i], session_id, role, content, message_time.isoformat()))
+        return rows
+
+    @staticmethod
+    def _message_dicts(rows: List[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        """Message dicts for rows produced by _conversation_rows."""
+        return [
+            {"id": message_id, "session_id": session_id, "role": role, "content": content, "created_at": created_at}
+            for message_id, session_id, role, content, created_at in rows
+        ]
 
     @classmethod
     def create_sessions_with_conversations(
@@ -188,7 +224,9 @@ class MessageFactory(BaseFactory):
         project_id: str,
         num_sessions: int,
         days_range: tuple = (1, 60),
-    ) -> List[Dict[str, Any]]:
+        return_rows: bool = True,
+        drop_indexes: bool = False,
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Create multiple sessions with German conversations.
 
@@ -197,41 +235,53 @@ class MessageFactory(BaseFactory):
             project_id: Project ID
             num_sessions: Number of sessions to create
             days_range: Tuple of (min_days_ago, max_days_ago) for session creation
+            return_rows: Set to False to only insert rows, without building
+                session and message dicts (e.g. for large seeds)
+            drop_indexes: Drop the secondary indexes on messages during the
+                insert and rebuild them afterwards (for large seeds)
 
         Returns:
-            List of created sessions with their messages
+            List of created sessions with their messages, or None if
+            return_rows is False
         """
         min_days, max_days = days_range
         sessions = []
 
-        # Shuffle conversations to vary content
-        available_conversations = get_conversations().copy()
-        random.shuffle(available_conversations)
+        # Visit conversations in a random order to vary content; the cached
+        # conversations themselves are never copied or reordered
+        conversations = get_conversations()
+        order = random.sample(range(len(conversations)), len(conversations))
+
+        # Build all rows in memory, then write each table with one executemany
+        session_ids = cls.generate_ids(num_sessions)
+        days_ago_list = random.choices(range(min_days, max_days + 1), k=num_sessions)
+        titles = random.choices(get_session_titles(), k=num_sessions)
+        session_rows = []
+        message_rows = []
 
         for i in range(num_sessions):
-            days_ago = random.randint(min_days, max_days)
-            base_date = cls.get_base_date(days_ago)
+            base_date = cls.get_base_date(days_ago_list[i])
 
-            # Create session
-            session = SessionFactory.create(
-                conn,
-                project_id=project_id,
-                created_at=base_date.isoformat(),
-            )
+            created_at = base_date.isoformat()
+            session_row = (session_ids[i], project_id, titles[i], created_at, created_at)
+            session_rows.append(session_row)
 
             # Pick a conversation (cycle through if more sessions than conversations)
-            conv_idx = i % len(available_conversations)
-            conversation = available_conversations[conv_idx]
+            conversation = conversations[order[i % len(order)]]
+
+            rows = cls._conversation_rows(session_ids[i], conversation, base_date)
+            message_rows.extend(rows)
 
-            # Create messages
-            messages = cls.create_conversation(
-                conn,
-                session_id=session["id"],
-                conversation=conversation,
-                base_timestamp=base_date.isoformat(),
-            )
+            if return_rows:
+                session = dict(zip(_SESSION_COLUMNS, session_row))
+                session["messages"] = cls._message_dicts(rows)
+                sessions.append(session)
 
-            session["messages"] = messages
-            sessions.append(session)
+        conn.executemany(_INSERT_SESSION_SQL, session_rows)
+        with cls.deferred_indexes(conn, "messages") if drop_indexes else nullcontext():
+            if len(message_rows) > _MULTI_ROW_THRESHOLD:
+                cls.insert_multi_row(conn, "messages", _MESSAGE_COLUMNS, message_rows)
+            else:
+                conn.executemany(_INSERT_MESSAGE_SQL, message_rows)
 
-        return sessions
+        return sessions if return_rows else None
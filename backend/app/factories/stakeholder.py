@@ -4,16 +4,13 @@ Stakeholder factories for generating stakeholder groups and assessments.
 
 import random
 import sqlite3
-from typing import Any, Dict, List, Optional
+from contextlib import nullcontext
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from .base import BaseFactory
-from ..constants import (
-    get_indicators_for_group_type,
-    CORE_INDICATORS,
-    FUEHRUNGSKRAEFTE_INDICATORS,
-)
-from ..prompts import load_constants
+from ..constants import get_indicator_keys_for_group_type
+from ..prompts import constants_cache, load_constants
 
 
 def get_group_names() -> Dict[str, List[str]]:
@@ -21,14 +18,51 @@ def get_group_names() -> Dict[str, List[str]]:
     return load_constants("group_names")
 
 
+@constants_cache
+def get_group_types() -> Tuple[str, ...]:
+    """Group types that have localized names, for random selection."""
+    return tuple(get_group_names().keys())
+
+
 def get_assessment_notes() -> Dict[str, List[str]]:
     """Load localized assessment notes."""
     return load_constants("assessment_notes")
 
 
+_LEVELS = ("high", "low")
+
+_DEFAULT_RATINGS = range(4, 9)
+
+_GROUP_COLUMNS = (
+    "id", "project_id", "group_type", "name", "power_level", "interest_level", "notes",
+    "created_at",
+)
+
+_INSERT_GROUP_SQL = """
+    INSERT INTO stakeholder_groups
+    (id, project_id, group_type, name, power_level, interest_level, notes, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_ASSESSMENT_COLUMNS = (
+    "id", "stakeholder_group_id", "indicator_key", "rating", "notes", "assessed_at",
+)
+
+# Above this many assessments, impulse seeding switches to multi-row VALUES inserts
+_MULTI_ROW_THRESHOLD = 200
+
+_INSERT_ASSESSMENT_SQL = """
+    INSERT INTO stakeholder_assessments
+    (id, stakeholder_group_id, indicator_key, rating, notes, assessed_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
 class StakeholderGroupFactory(BaseFactory):
     """Factory for creating stakeholder group entities."""
 
+    _COLUMNS = _GROUP_COLUMNS
+
     @classmethod
     def build(
         cls,
@@ -39,20 +73,21 @@ class StakeholderGroupFactory(BaseFactory):
         interest_level: Optional[str] = None,
         notes: Optional[str] = None,
         created_at: Optional[str] = None,
+        id: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Build a stakeholder group dict without persisting."""
         group_names = get_group_names()
-        group_type = group_type or random.choice(list(group_names.keys()))
+        group_type = group_type or random.choice(get_group_types())
         name = name or random.choice(group_names.get(group_type, ["Unknown Group"]))
 
         return {
-            "id": cls.generate_id(),
+            "id": id or cls.generate_id(),
             "project_id": project_id,
             "group_type": group_type,
             "name": name,
-            "power_level": power_level or random.choice(["high", "low"]),
-            "interest_level": interest_level or random.choice(["high", "low"]),
+            "power_level": power_level or _LEVELS[random.getrandbits(1)],
+            "interest_level": interest_level or _LEVELS[random.getrandbits(1)],
             "notes": notes,
             "created_at": created_at or cls.generate_timestamp(),
         }
@@ -82,27 +117,14 @@ class StakeholderGroupFactory(BaseFactory):
             **kwargs
         )
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO stakeholder_groups
-            (id, project_id, group_type, name, power_level, interest_level, notes, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["project_id"],
-                data["group_type"],
-                data["name"],
-                data["power_level"],
-                data["interest_level"],
-                data["notes"],
-                data["created_at"],
-            )
-        )
+        conn.execute(_INSERT_GROUP_SQL, cls._row_tuple(data))
 
         return data
 
+    @classmethod
+    def _insert_sql(cls) -> str:
+        return _INSERT_GROUP_SQL
+
     @classmethod
     def create_standard_set(
         cls,
@@ -131,18 +153,22 @@ class StakeholderGroupFactory(BaseFactory):
         }
         positions = mendelow_positions or default_positions
 
+        group_types = ["fuehrungskraefte", "multiplikatoren", "mitarbeitende"]
+        created_at = created_at or cls.generate_timestamp()
+
         groups = []
-        for group_type in ["fuehrungskraefte", "multiplikatoren", "mitarbeitende"]:
+        for group_type, group_id in zip(group_types, cls.generate_ids(len(group_types))):
             power, interest = positions.get(group_type, ("low", "low"))
-            group = cls.create(
-                conn,
+            groups.append(cls.build(
                 project_id=project_id,
                 group_type=group_type,
                 power_level=power,
                 interest_level=interest,
                 created_at=created_at,
-            )
-            groups.append(group)
+                id=group_id,
+            ))
+
+        conn.executemany(_INSERT_GROUP_SQL, [cls._row_tuple(group) for group in groups])
 
         return groups
 
@@ -150,6 +176,8 @@ class StakeholderGroupFactory(BaseFactory):
 class StakeholderAssessmentFactory(BaseFactory):
     """Factory for creating stakeholder assessment entities."""
 
+    _COLUMNS = _ASSESSMENT_COLUMNS
+
     @classmethod
     def build(
         cls,
@@ -158,6 +186,7 @@ class StakeholderAssessmentFactory(BaseFactory):
         rating: Optional[int] = None,
         notes: Optional[str] = None,
         assessed_at: Optional[str] = None,
+        id: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Build an assessment dict without persisting."""
@@ -167,10 +196,10 @@ class StakeholderAssessmentFactory(BaseFactory):
             notes = random.choice(assessment_notes[indicator_key])
 
         return {
-            "id": cls.generate_id(),
+            "id": id or cls.generate_id(),
             "stakeholder_group_id": stakeholder_group_id,
             "indicator_key": indicator_key,
-            "rating": rating if rating is not None else random.randint(4, 8),
+            "rating": rating if rating is not None else random.choice(_DEFAULT_RATINGS),
             "notes": notes,
             "assessed_at": assessed_at or cls.generate_timestamp(),
         }
@@ -196,25 +225,19 @@ class StakeholderAssessmentFactory(BaseFactory):
             **kwargs
         )
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO stakeholder_assessments
-            (id, stakeholder_group_id, indicator_key, rating, notes, assessed_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["stakeholder_group_id"],
-                data["indicator_key"],
-                data["rating"],
-                data["notes"],
-                data["assessed_at"],
-            )
-        )
+        conn.execute(_INSERT_ASSESSMENT_SQL, cls._row_tuple(data))
 
         return data
 
+    @classmethod
+    def _insert_sql(cls) -> str:
+        return _INSERT_ASSESSMENT_SQL
+
+    @classmethod
+    def _insert_many(cls, conn: sqlite3.Connection, rows: List[Dict[str, Any]]) -> None:
+        """Persist built assessment dicts with a single executemany."""
+        conn.executemany(_INSERT_ASSESSMENT_SQL, [cls._row_tuple(row) for row in rows])
+
     @classmethod
     def create_full_assessment(
         cls,
@@ -237,19 +260,36 @@ class StakeholderAssessmentFactory(BaseFactory):
         Returns:
             List of created assessments
         """
-        indicators = get_indicators_for_group_type(group_type)
-        ratings = ratings or {}
+        assessments = cls._build_full_assessment(
+            stakeholder_group_id, group_type, assessed_at, ratings
+        )
+        cls._insert_many(conn, assessments)
+        return assessments
+
+    @classmethod
+    def _build_full_assessment(
+        cls,
+        stakeholder_group_id: str,
+        group_type: str,
+        assessed_at: Optional[str] = None,
+        ratings: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Build one assessment per indicator of the group type without persisting."""
+        keys = get_indicator_keys_for_group_type(group_type)
+        get_rating = (ratings or {}).get
+        # Fallback ratings for indicators without one, drawn in a single call
+        random_ratings = random.choices(_DEFAULT_RATINGS, k=len(keys))
+        ids = cls.generate_ids(len(keys))
 
         assessments = []
-        for indicator in indicators:
-            key = indicator["key"]
-            rating = ratings.get(key)  # Will use random if None
-            assessment = cls.create(
-                conn,
+        for key, random_rating, assessment_id in zip(keys, random_ratings, ids):
+            rating = get_rating(key)
+            assessment = cls.build(
                 stakeholder_group_id=stakeholder_group_id,
                 indicator_key=key,
-                rating=rating,
+                rating=rating if rating is not None else random_rating,
                 assessed_at=assessed_at,
+                id=assessment_id,
             )
             assessments.append(assessment)
 
@@ -264,7 +304,9 @@ class StakeholderAssessmentFactory(BaseFactory):
         num_impulses: int,
         start_days_ago: int,
         rating_history: Dict[str, List[float]],
-    ) -> List[List[Dict[str, Any]]]:
+        return_rows: bool = True,
+        drop_indexes: bool = False,
+    ) -> Optional[List[List[Dict[str, Any]]]]:
         """
         Create a complete impulse history for a stakeholder group.
 
@@ -275,10 +317,51 @@ class StakeholderAssessmentFactory(BaseFactory):
             num_impulses: Number of impulses to create
             start_days_ago: How many days ago the first impulse was
             rating_history: Dict of indicator_key -> list of ratings over time
+            return_rows: Set to False to only insert rows, without building
+                the assessment dicts
+            drop_indexes: Drop the secondary indexes on stakeholder_assessments
+                during the insert and rebuild them afterwards (for large seeds);
+                they are restored if the insert fails
 
         Returns:
-            List of impulse sets (each impulse is a list of assessments)
+            List of impulse sets (each impulse is a list of assessments), or None
+            if return_rows is False
         """
+        rows = cls._impulse_rows(
+            stakeholder_group_id, group_type, num_impulses, start_days_ago, rating_history
+        )
+
+        multi_row = num_impulses * len(get_indicator_keys_for_group_type(group_type)) > _MULTI_ROW_THRESHOLD
+        if return_rows or multi_row:
+            rows = list(rows)
+
+        with cls.deferred_indexes(conn, "stakeholder_assessments") if drop_indexes else nullcontext():
+            if multi_row:
+                cls.insert_multi_row(conn, "stakeholder_assessments", _ASSESSMENT_COLUMNS, rows)
+            else:
+                # A generator is streamed straight into executemany
+                conn.executemany(_INSERT_ASSESSMENT_SQL, rows)
+
+        if not return_rows:
+            return None
+
+        per_impulse = len(get_indicator_keys_for_group_type(group_type))
+        return [
+            [dict(zip(_ASSESSMENT_COLUMNS, row)) for row in rows[i * per_impulse:(i + 1) * per_impulse]]
+            for i in range(num_impulses)
+        ]
+
+    @classmethod
+    def _impulse_rows(
+        cls,
+        stakeholder_group_id: str,
+        group_type: str,
+        num_impulses: int,
+        start_days_ago: int,
+        rating_history: Dict[str, List[float]],
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Yield assessment rows in _ASSESSMENT_COLUMNS order, impulse by impulse."""
+        keys = get_indicator_keys_for_group_type(group_type)
         base_date = cls.get_base_date(start_days_ago)
 
         # Calculate days between impulses (bi-weekly = 14 days)
@@ -287,26 +370,39 @@ class StakeholderAssessmentFactory(BaseFactory):
         else:
             days_between = 0
 
-        impulses = []
-        for i in range(num_impulses):
-            # Calculate date for this impulse
-            days_offset = int(i * days_between)
-            impulse_date = cls.generate_timestamp_from_base(base_date, days_offset)
-
-            # Get ratings for this impulse
-            impulse_ratings = {}
-            for key, ratings in rating_history.items():
-                if i < len(ratings):
-                    impulse_ratings[key] = int(round(ratings[i]))
-
-            # Create the full assessment for this date
-            assessments = cls.create_full_assessment(
-                conn,
-                stakeholder_group_id=stakeholder_group_id,
-                group_type=group_type,
-                assessed_at=impulse_date,
-                ratings=impulse_ratings,
-            )
-            impulses.append(assessments)
+        # Timestamp of each impulse, computed once up front
+        impulse_dates = [
+            cls.generate_timestamp_from_base(base_date, int(i * days_between))
+            for i in range(num_impulses)
+        ]
 
-        return impulses
+        # Draw every impulse's notes per indicator up front
+        assessment_notes = get_assessment_notes()
+        note_samples = {
+            key: random.choices(assessment_notes[key], k=num_impulses)
+            for key in keys
+            if key in assessment_notes
+        }
+        # Round each indicator's history once instead of per impulse
+        rounded_history = {
+            key: [int(round(rating)) for rating in ratings[:num_impulses]]
+            for key, ratings in rating_history.items()
+        }
+        # Fallback ratings for cells missing from rating_history
+        random_ratings = iter(random.choices(_DEFAULT_RATINGS, k=num_impulses * len(keys)))
+        ids = iter(cls.generate_ids(num_impulses * len(keys)))
+
+        # Resolve the per-indicator lookups once, outside the row loop
+        columns = [(key, rounded_history.get(key), note_samples.get(key)) for key in keys]
+
+        for i, impulse_date in enumerate(impulse_dates):
+            for key, history, samples in columns:
+                random_rating = next(random_ratings)
+                yield (
+                    next(ids),
+                    stakeholder_group_id,
+                    key,
+                    history[i] if history is not None and i < len(history) else random_rating,
+                    samples[i] if samples is not None else None,
+                    impulse_date,
+                )
@@ -4,7 +4,22 @@ Rating pattern algorithms for generating realistic impulse histories.
 
 import math
 import random
-from typing import List, Dict, Literal
+from functools import lru_cache
+from typing import List, Dict, Literal, Sequence, Tuple
+
+# Angular frequencies of the two waves in the volatile pattern
+_FOUR_PI = 4 * math.pi
+_TWO_POINT_FIVE_PI = 2.5 * math.pi
+# Steepness of the S-curve in the steady improvement pattern
+_TANH_SCALE = 3
+
+
+@lru_cache(maxsize=None)
+def _progress(n: int) -> Tuple[float, ...]:
+    """Evenly spaced progress values from 0 to 1 for n points."""
+    last = max(1, n - 1)
+    return tuple(i / last for i in range(n))
+
 
 PatternType = Literal[
     "honeymoon_dip_recovery",
@@ -45,6 +60,15 @@ class RatingPatternGenerator:
         "vorbildfunktion": 0.3,          # Visible, easier to track
     }
 
+    # Pattern type -> classmethod computing its curve from the progress grid
+    PATTERN_METHODS: Dict[str, str] = {
+        "honeymoon_dip_recovery": "_honeymoon_dip_recovery",
+        "steady_improvement": "_steady_improvement",
+        "struggle_then_improve": "_struggle_then_improve",
+        "volatile": "_volatile",
+        "declining": "_declining",
+    }
+
     @classmethod
     def get_base_rating(cls, group_type: str, indicator_key: str) -> float:
         """Get the base rating for a group type and indicator."""
@@ -75,131 +99,107 @@ class RatingPatternGenerator:
             List of ratings (1-10 scale)
         """
         base = cls.get_base_rating(group_type, indicator_key)
+        return cls._apply_noise(base, cls._shape(pattern_type, num_points), noise_level)
 
-        if pattern_type == "honeymoon_dip_recovery":
-            values = cls._honeymoon_dip_recovery(num_points, base)
-        elif pattern_type == "steady_improvement":
-            values = cls._steady_improvement(num_points, base)
-        elif pattern_type == "struggle_then_improve":
-            values = cls._struggle_then_improve(num_points, base)
-        elif pattern_type == "volatile":
-            values = cls._volatile(num_points, base)
-        elif pattern_type == "declining":
-            values = cls._declining(num_points, base)
-        else:
-            # Default to steady
-            values = [base] * num_points
+    @classmethod
+    def _apply_noise(cls, base: float, shape: Tuple[float, ...], noise_level: float) -> List[float]:
+        """Offset a pattern curve by base, add noise and clamp to the 1-10 scale."""
+        gauss = random.gauss
+        return [
+            round(max(1.0, min(10.0, base + offset + gauss(0, noise_level))), 1)
+            for offset in shape
+        ]
 
-        # Add noise and clamp
-        noisy_values = []
-        for v in values:
-            noise = random.gauss(0, noise_level)
-            clamped = max(1.0, min(10.0, v + noise))
-            noisy_values.append(round(clamped, 1))
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _shape(cls, pattern_type: PatternType, n: int) -> Tuple[float, ...]:
+        """
+        Noise-free pattern curve as offsets from the base rating.
 
-        return noisy_values
+        The curve only depends on the pattern and the number of points, so it
+        is shared by every group and indicator generated with the same pair.
+        """
+        method_name = cls.PATTERN_METHODS.get(pattern_type)
+        if method_name is None:
+            # Default to steady
+            return (0.0,) * n
+        return tuple(getattr(cls, method_name)(_progress(n)))
 
     @classmethod
-    def _honeymoon_dip_recovery(cls, n: int, base: float) -> List[float]:
+    def _honeymoon_dip_recovery(cls, progress: Tuple[float, ...]) -> List[float]:
         """
         Pattern: High optimism -> reality check valley -> gradual recovery
         Typical for: Fuehrungskraefte who start enthusiastic then face implementation challenges
 
         Shape: 7.5 -> 5 (at ~40%) -> 6.5
         """
-        values = []
-        for i in range(n):
-            progress = i / max(1, n - 1)  # 0 to 1
-
-            if progress < 0.15:
-                # Honeymoon phase: start high
-                val = base + 1.5 - (progress / 0.15) * 0.5
-            elif progress < 0.45:
-                # Dip phase: dropping
-                dip_progress = (progress - 0.15) / 0.30
-                val = base + 1.0 - dip_progress * 2.5
-            else:
-                # Recovery phase: climbing back
-                recovery_progress = (progress - 0.45) / 0.55
-                val = base - 1.5 + recovery_progress * 2.0
-
-            values.append(val)
-        return values
+        return [
+            # Honeymoon phase: start high
+            1.5 - (p / 0.15) * 0.5 if p < 0.15
+            # Dip phase: dropping
+            else 1.0 - ((p - 0.15) / 0.30) * 2.5 if p < 0.45
+            # Recovery phase: climbing back
+            else -1.5 + ((p - 0.45) / 0.55) * 2.0
+            for p in progress
+        ]
 
     @classmethod
-    def _steady_improvement(cls, n: int, base: float) -> List[float]:
+    def _steady_improvement(cls, progress: Tuple[float, ...]) -> List[float]:
         """
         Pattern: Gradual consistent improvement over time
         Typical for: Multiplikatoren who are committed and see gradual results
 
         Shape: base-0.5 -> base+1.5 (linear with slight curve)
         """
-        values = []
-        for i in range(n):
-            progress = i / max(1, n - 1)
-            # Slight S-curve for more natural progression
-            curved = 0.5 * (1 + math.tanh((progress - 0.5) * 3))
-            val = (base - 0.5) + curved * 2.0
-            values.append(val)
-        return values
+        # Slight S-curve for more natural progression
+        return [
+            -0.5 + 0.5 * (1 + math.tanh((p - 0.5) * _TANH_SCALE)) * 2.0
+            for p in progress
+        ]
 
     @classmethod
-    def _struggle_then_improve(cls, n: int, base: float) -> List[float]:
+    def _struggle_then_improve(cls, progress: Tuple[float, ...]) -> List[float]:
         """
         Pattern: Low start -> extended struggle -> turning point -> rapid improvement
         Typical for: Mitarbeitende who need time to see benefits
 
         Shape: 4.5 -> flat at 5 (60%) -> 7
         """
-        values = []
-        for i in range(n):
-            progress = i / max(1, n - 1)
-
-            if progress < 0.6:
-                # Struggle phase: low and flat with slight improvements
-                val = base - 1.5 + progress * 0.5
-            else:
-                # Improvement phase: rapid climb
-                improvement_progress = (progress - 0.6) / 0.4
-                val = base - 1.0 + improvement_progress * 2.5
-
-            values.append(val)
-        return values
+        return [
+            # Struggle phase: low and flat with slight improvements
+            -1.5 + p * 0.5 if p < 0.6
+            # Improvement phase: rapid climb
+            else -1.0 + ((p - 0.6) / 0.4) * 2.5
+            for p in progress
+        ]
 
     @classmethod
-    def _volatile(cls, n: int, base: float) -> List[float]:
+    def _volatile(cls, progress: Tuple[float, ...]) -> List[float]:
         """
         Pattern: Oscillating up and down with no clear trend
         Typical for: Groups with inconsistent leadership or mixed signals
 
         Shape: Sine wave around base +/- 1.5
         """
-        values = []
-        for i in range(n):
-            progress = i / max(1, n - 1)
-            # Multiple sine waves for irregular pattern
-            wave1 = math.sin(progress * 4 * math.pi) * 1.0
-            wave2 = math.sin(progress * 2.5 * math.pi + 1) * 0.5
-            val = base + wave1 + wave2
-            values.append(val)
-        return values
+        # Multiple sine waves for irregular pattern
+        return [
+            math.sin(p * _FOUR_PI) * 1.0 + math.sin(p * _TWO_POINT_FIVE_PI + 1) * 0.5
+            for p in progress
+        ]
 
     @classmethod
-    def _declining(cls, n: int, base: float) -> List[float]:
+    def _declining(cls, progress: Tuple[float, ...]) -> List[float]:
         """
         Pattern: Concerning downward trend
         Typical for: Crisis situations, leadership issues, loss of trust
 
         Shape: base+0.5 -> base-2.0 (gradual decline)
         """
-        values = []
-        for i in range(n):
-            progress = i / max(1, n - 1)
-            # Accelerating decline
-            decline = progress * progress * 2.5
-            val = base + 0.5 - decline
-            values.append(val)
-        return values
+        # Accelerating decline
+        return [
+            0.5 - p * p * 2.5
+            for p in progress
+        ]
 
     @classmethod
     def generate_assessment_history(
@@ -207,7 +207,7 @@ class RatingPatternGenerator:
         pattern_type: PatternType,
         num_impulses: int,
         group_type: str,
-        indicator_keys: List[str],
+        indicator_keys: Sequence[str],
         noise_level: float = 0.3
     ) -> Dict[str, List[float]]:
         """
@@ -223,15 +223,16 @@ class RatingPatternGenerator:
         Returns:
             Dict mapping indicator_key -> list of ratings over time
         """
+        # All indicators share one curve; only base and noise differ
+        shape = cls._shape(pattern_type, num_impulses)
+
         history = {}
         for key in indicator_keys:
             # Slightly vary noise per indicator for natural feel
             indicator_noise = noise_level + random.uniform(-0.1, 0.1)
-            history[key] = cls.generate_pattern(
-                pattern_type,
-                num_impulses,
-                group_type,
-                key,
+            history[key] = cls._apply_noise(
+                cls.get_base_rating(group_type, key),
+                shape,
                 max(0.1, indicator_noise)
             )
         return history
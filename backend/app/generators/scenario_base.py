@@ -102,7 +102,7 @@ class ScenarioGenerator(ABC):
         Returns:
             Dict mapping group_id to list of impulses
         """
-        from ..constants import get_indicators_for_group_type
+        from ..constants import get_indicator_keys_for_group_type
 
         all_impulses = {}
 
@@ -112,8 +112,7 @@ class ScenarioGenerator(ABC):
             pattern = patterns.get(group_type, "steady_improvement")
 
             # Get indicators for this group type
-            indicators = get_indicators_for_group_type(group_type)
-            indicator_keys = [ind["key"] for ind in indicators]
+            indicator_keys = get_indicator_keys_for_group_type(group_type)
 
             # Generate rating history using pattern
             rating_history = RatingPatternGenerator.generate_assessment_history(
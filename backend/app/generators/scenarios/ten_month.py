@@ -37,7 +37,7 @@ class TenMonthScenario(ScenarioGenerator):
     @classmethod
     def generate(cls, conn: sqlite3.Connection) -> Dict[str, Any]:
         """Generate a 10-month project scenario."""
-        from ...constants import get_indicators_for_group_type
+        from ...constants import get_indicator_keys_for_group_type
 
         # Load localized scenario data
         scenarios = load_constants("scenarios")
@@ -105,8 +105,7 @@ class TenMonthScenario(ScenarioGenerator):
             else:
                 pattern = patterns.get(group_type, "steady_improvement")
 
-            indicators = get_indicators_for_group_type(group_type)
-            indicator_keys = [ind["key"] for ind in indicators]
+            indicator_keys = get_indicator_keys_for_group_type(group_type)
 
             rating_history = RatingPatternGenerator.generate_assessment_history(
                 pattern_type=pattern,
@@ -127,8 +126,7 @@ class TenMonthScenario(ScenarioGenerator):
 
         # Create partial impulse history for the later-added group
         # Only 10 impulses (since added at month 5)
-        later_indicators = get_indicators_for_group_type("mitarbeitende")
-        later_indicator_keys = [ind["key"] for ind in later_indicators]
+        later_indicator_keys = get_indicator_keys_for_group_type("mitarbeitende")
 
         later_rating_history = RatingPatternGenerator.generate_assessment_history(
             pattern_type="steady_improvement",  # Better managed group
@@ -17,7 +17,7 @@ from .agents.chat import ChatAgent
 from .agents.dashboard import DashboardAgent
 from .agents.generator_chat import GeneratorChatAgent
 from .agents.mcp_client import MCPClientManager
-from .database import init_database
+from .database import init_database, close_connections
 from .routers import sessions, projects, documents, workflow, stakeholders, surveys, recommendations, seed, insights
 
 # Load .env from project root
@@ -47,6 +47,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Warning: Error disconnecting MCP client: {e}")
 
+    # Close pooled database connections
+    close_connections()
+
 
 app = FastAPI(title="Sentio Backend", lifespan=lifespan)
 
@@ -7,7 +7,7 @@ import os
 import yaml
 from pathlib import Path
 from functools import lru_cache
-from typing import Any
+from typing import Any, Callable, List, TypeVar
 from dotenv import load_dotenv
 
 # Load .env from project root (in case this module is imported before main.py)
@@ -20,8 +20,20 @@ LOCALE = os.getenv("LOCALE", "en")
 # Base path for prompt files
 PROMPTS_DIR = Path(__file__).parent
 
+F = TypeVar("F", bound=Callable[..., Any])
 
-@lru_cache(maxsize=32)
+# Caches of data derived from load_constants(), reset by clear_cache()
+_derived_caches: List[Callable[..., Any]] = []
+
+
+@lru_cache(maxsize=None)
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file once; every key lookup afterwards reuses the result."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@lru_cache(maxsize=None)
 def load_prompt(agent: str, key: str = "system") -> str:
     """
     Load a prompt from a YAML file based on the current locale.
@@ -43,8 +55,7 @@ def load_prompt(agent: str, key: str = "system") -> str:
     if not path.exists():
         path = PROMPTS_DIR / "en" / f"{agent}.yaml"
 
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(path)
 
     if key not in data:
         raise KeyError(f"Key '{key}' not found in {path}")
@@ -52,7 +63,7 @@ def load_prompt(agent: str, key: str = "system") -> str:
     return data[key]
 
 
-@lru_cache(maxsize=32)
+@lru_cache(maxsize=None)
 def load_constants(key: str) -> Any:
     """
     Load localized constants from the constants.yaml file.
@@ -69,8 +80,7 @@ def load_constants(key: str) -> Any:
     if not path.exists():
         path = PROMPTS_DIR / "en" / "constants.yaml"
 
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(path)
 
     if key not in data:
         raise KeyError(f"Key '{key}' not found in constants.yaml")
@@ -78,6 +88,18 @@ def load_constants(key: str) -> Any:
     return data[key]
 
 
+def constants_cache(func: F) -> F:
+    """
+    Cache a function that derives data from load_constants().
+
+    Unlike a bare lru_cache, the cache is reset by clear_cache() together with
+    the constants it was derived from, so locale changes take effect.
+    """
+    cached = lru_cache(maxsize=None)(func)
+    _derived_caches.append(cached)
+    return cached
+
+
 def get_locale() -> str:
     """Return the current locale."""
     return LOCALE
@@ -85,5 +107,8 @@ def get_locale() -> str:
 
 def clear_cache():
     """Clear the prompt cache. Useful for testing or locale changes."""
+    _load_yaml.cache_clear()
     load_prompt.cache_clear()
     load_constants.cache_clear()
+    for cached in _derived_caches:
+        cached.cache_clear()
@@ -10,6 +10,7 @@ from enum import Enum
 import uuid
 import json
 import asyncio
+import orjson
 
 from ..database import get_connection, dict_from_row
 from ..agents.recommendations import RecommendationAgent
@@ -102,8 +103,8 @@ def row_to_recommendation(row) -> RecommendationModel:
     """Convert a database row to a RecommendationModel."""
     data = dict_from_row(row)
     # Parse JSON fields
-    affected_groups = json.loads(data.get("affected_groups") or "[]")
-    steps = json.loads(data.get("steps") or "[]")
+    affected_groups = orjson.loads(data.get("affected_groups") or "[]")
+    steps = orjson.loads(data.get("steps") or "[]")
 
     return RecommendationModel(
         id=data["id"],
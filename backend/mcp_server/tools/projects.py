@@ -55,11 +55,10 @@ async def project_create(name: str, goal: Optional[str] = None, icon: Optional[s
         """, (project_id, name, project_icon, goal, now, now))
 
         # Also create initial workflow state
-        workflow_id = str(uuid.uuid4())
         cursor.execute("""
-            INSERT INTO workflow_state (id, project_id, current_stage, created_at, updated_at)
-            VALUES (?, ?, 'define_indicators', ?, ?)
-        """, (workflow_id, project_id, now, now))
+            INSERT INTO workflow_state (project_id, current_stage, created_at, updated_at)
+            VALUES (?, 'define_indicators', ?, ?)
+        """, (project_id, now, now))
 
         cursor.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
         return json.dumps(dict_from_row(cursor.fetchone()))
@@ -7,6 +7,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
+import orjson
+
 from app.database import get_connection, dict_from_row
 
 
@@ -42,8 +44,8 @@ async def recommendation_list(project_id: str, status: Optional[str] = None) ->
         for row in cursor.fetchall():
             rec = dict_from_row(row)
             # Parse JSON fields
-            rec["affected_groups"] = json.loads(rec.get("affected_groups") or "[]")
-            rec["steps"] = json.loads(rec.get("steps") or "[]")
+            rec["affected_groups"] = orjson.loads(rec.get("affected_groups") or "[]")
+            rec["steps"] = orjson.loads(rec.get("steps") or "[]")
             recommendations.append(rec)
 
         return json.dumps(recommendations)
@@ -61,8 +63,8 @@ async def recommendation_get(recommendation_id: str) -> str:
 
         rec = dict_from_row(row)
         # Parse JSON fields
-        rec["affected_groups"] = json.loads(rec.get("affected_groups") or "[]")
-        rec["steps"] = json.loads(rec.get("steps") or "[]")
+        rec["affected_groups"] = orjson.loads(rec.get("affected_groups") or "[]")
+        rec["steps"] = orjson.loads(rec.get("steps") or "[]")
 
         return json.dumps(rec)
 
@@ -221,8 +223,8 @@ async def recommendation_update(
 
         cursor.execute("SELECT * FROM recommendations WHERE id = ?", (recommendation_id,))
         rec = dict_from_row(cursor.fetchone())
-        rec["affected_groups"] = json.loads(rec.get("affected_groups") or "[]")
-        rec["steps"] = json.loads(rec.get("steps") or "[]")
+        rec["affected_groups"] = orjson.loads(rec.get("affected_groups") or "[]")
+        rec["steps"] = orjson.loads(rec.get("steps") or "[]")
 
         return json.dumps(rec)
 
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for backend tests.
+"""
+
+import pytest
+
+from app import database, prompts
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point the app at a fresh, initialized SQLite database for one test."""
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "test.db"))
+    database.init_database()
+    yield database
+    database.close_connections()
+
+
+@pytest.fixture
+def switch_locale(monkeypatch):
+    """Switch the prompt locale for one test, clearing the caches like a locale change would."""
+    def switch(locale):
+        monkeypatch.setattr(prompts, "LOCALE", locale)
+        prompts.clear_cache()
+
+    yield switch
+    monkeypatch.undo()
+    prompts.clear_cache()
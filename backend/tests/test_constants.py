@@ -0,0 +1,38 @@
+"""
+Tests for the fixed indicator constants.
+"""
+
+import pytest
+
+from app.constants import (
+    CORE_INDICATORS,
+    FUEHRUNGSKRAEFTE_INDICATORS,
+    GroupType,
+    get_indicator_keys_for_group_type,
+    get_indicators_for_group_type,
+)
+
+
+def test_indicators_for_group_type_accepts_enum_and_string():
+    assert get_indicators_for_group_type(GroupType.FUEHRUNGSKRAEFTE) == FUEHRUNGSKRAEFTE_INDICATORS
+    assert get_indicators_for_group_type("mitarbeitende") == CORE_INDICATORS
+    assert get_indicator_keys_for_group_type("multiplikatoren") == tuple(
+        indicator["key"] for indicator in CORE_INDICATORS
+    )
+
+
+@pytest.mark.parametrize("lookup", [get_indicators_for_group_type, get_indicator_keys_for_group_type])
+def test_unknown_group_type_raises(lookup):
+    with pytest.raises(ValueError):
+        lookup("mitarbeiter")
+
+
+def test_clear_cache_reloads_constants_for_new_locale(switch_locale):
+    from app import constants
+
+    switch_locale("en")
+    english = constants.CORE_INDICATORS
+
+    switch_locale("de")
+    assert constants.CORE_INDICATORS != english
+    assert [i["key"] for i in constants.CORE_INDICATORS] == [i["key"] for i in english]
@@ -0,0 +1,89 @@
+"""
+Tests for the entity factories.
+"""
+
+import sqlite3
+
+import pytest
+
+from app.factories.base import BaseFactory
+
+
+def _index_names(conn, table):
+    return {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,)
+        )
+    }
+
+
+def test_deferred_indexes_rebuilds_indexes(db):
+    with db.get_connection() as conn:
+        before = _index_names(conn, "messages")
+        assert before
+
+        with BaseFactory.deferred_indexes(conn, "messages"):
+            assert _index_names(conn, "messages") == set()
+
+        assert _index_names(conn, "messages") == before
+
+    with db.get_connection() as conn:
+        assert _index_names(conn, "messages") == before
+
+
+def test_deferred_indexes_restores_indexes_on_error(db):
+    with db.get_connection() as conn:
+        before = _index_names(conn, "messages")
+
+    # No transaction is open when the indexes are dropped
+    conn = sqlite3.connect(db.get_db_path())
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        with pytest.raises(sqlite3.IntegrityError):
+            with BaseFactory.deferred_indexes(conn, "messages"):
+                conn.execute(
+                    "INSERT INTO messages (id, session_id, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
+                    ("m1", "missing-session", "user", "hi", "2024-01-01T00:00:00"),
+                )
+        conn.rollback()
+        assert _index_names(conn, "messages") == before
+    finally:
+        conn.close()
+
+
+def test_impulse_history_drop_indexes_keeps_indexes_on_failure(db):
+    from app.factories.stakeholder import StakeholderAssessmentFactory
+
+    with db.get_connection() as conn:
+        before = _index_names(conn, "stakeholder_assessments")
+        assert before
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.get_connection() as conn:
+            StakeholderAssessmentFactory.create_impulse_history(
+                conn,
+                stakeholder_group_id="missing-group",
+                group_type="mitarbeitende",
+                num_impulses=3,
+                start_days_ago=30,
+                rating_history={},
+                drop_indexes=True,
+            )
+
+    with db.get_connection() as conn:
+        assert _index_names(conn, "stakeholder_assessments") == before
+        assert conn.execute("SELECT COUNT(*) FROM stakeholder_assessments").fetchone()[0] == 0
+
+
+def test_create_batch_inserts_declared_columns(db):
+    from app.factories.project import ProjectFactory
+
+    with db.get_connection() as conn:
+        projects = ProjectFactory.create_batch(conn, 3)
+        rows = conn.execute("SELECT id, name, icon, goal FROM projects ORDER BY id").fetchall()
+
+    assert sorted(
+        (p["id"], p["name"], p["icon"], p["goal"]) for p in projects
+    ) == [tuple(row) for row in rows]
@@ -0,0 +1,43 @@
+"""
+Tests for the localized prompt and constants loaders.
+"""
+
+from app.factories.recommendation import get_recommendation_types, get_template_steps_json
+from app.prompts import load_constants
+
+
+def test_clear_cache_resets_derived_recommendation_caches(switch_locale):
+    switch_locale("en")
+    assert get_recommendation_types() == tuple(load_constants("recommendation_templates"))
+    english_steps = set(get_template_steps_json().values())
+
+    switch_locale("de")
+    assert set(get_template_steps_json().values()).isdisjoint(english_steps)
+
+
+def test_clear_cache_resets_session_constant_caches(switch_locale):
+    from app.factories.session import get_conversations, get_session_titles
+
+    switch_locale("en")
+    english = get_conversations()
+    assert get_session_titles() == load_constants("session_titles")
+
+    switch_locale("de")
+    assert get_conversations() != english
+    first_message = load_constants("conversations")[0][0]
+    assert get_conversations()[0][0] == (first_message["role"], first_message["content"])
+
+
+def test_clear_cache_resets_stakeholder_constant_caches(switch_locale):
+    from app.factories.stakeholder import get_assessment_notes, get_group_names, get_group_types
+
+    switch_locale("en")
+    english_names = get_group_names()
+    english_notes = get_assessment_notes()
+    assert get_group_types() == tuple(english_names)
+    assert get_group_types.cache_info().currsize == 1
+
+    switch_locale("de")
+    assert get_group_types.cache_info().currsize == 0
+    assert get_group_names() != english_names
+    assert get_assessment_notes() != english_notes
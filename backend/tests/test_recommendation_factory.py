@@ -0,0 +1,25 @@
+"""
+Tests for the recommendation factory.
+"""
+
+import orjson
+
+from app.factories.project import ProjectFactory
+from app.factories.recommendation import RecommendationFactory, get_recommendation_templates
+
+
+def test_steps_are_stored_as_json(db):
+    template_steps = get_recommendation_templates()["habit"][0]["steps"]
+    custom_steps = ["First step", "Second step"]
+
+    with db.get_connection() as conn:
+        project = ProjectFactory.create(conn)
+        from_template = RecommendationFactory.create(conn, project["id"], steps=list(template_steps))
+        custom = RecommendationFactory.create(conn, project["id"], steps=custom_steps)
+        stored = {
+            row["id"]: orjson.loads(row["steps"])
+            for row in conn.execute("SELECT id, steps FROM recommendations")
+        }
+
+    assert stored[from_template["id"]] == template_steps
+    assert stored[custom["id"]] == custom_steps
@@ -0,0 +1,165 @@
+"""
+Tests for the survey agent, with the OpenAI clients mocked out.
+"""
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents import survey
+from app.agents.survey import Survey, SurveyAgent
+from app.prompts import load_prompt
+
+
+SURVEY_JSON = json.dumps({
+    "title": "Pulse check",
+    "description": "How is the change going?",
+    "questions": [{"id": "q1", "type": "scale", "question": "How informed do you feel?"}],
+})
+
+
+class FakeLLM:
+    """Stands in for ChatOpenAI; fails for any prompt mentioning a broken group."""
+
+    model_name = "fake-model"
+    temperature = 0.7
+
+    async def ainvoke(self, messages):
+        if "Broken Group" in messages[-1][1]:
+            raise RuntimeError("rate limited")
+        return SimpleNamespace(content=SURVEY_JSON)
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = SurveyAgent()
+    agent.llm = agent.escalation_llm = FakeLLM()
+    return agent
+
+
+def _group(name):
+    return {
+        "group_name": name,
+        "group_type": "mitarbeitende",
+        "mendelow_quadrant": "Monitor",
+        "mendelow_strategy": "Keep an eye on them",
+        "impulse_history": [],
+    }
+
+
+def test_generate_surveys_for_groups_isolates_failures(agent, caplog):
+    with caplog.at_level(logging.WARNING, logger=survey.__name__):
+        surveys = asyncio.run(agent.generate_surveys_for_groups(
+            project_goal="Roll out the new ERP",
+            project_name="ERP",
+            groups=[_group("Working Group"), _group("Broken Group")],
+        ))
+
+    assert isinstance(surveys[0], Survey)
+    assert surveys[0].title == "Pulse check"
+    assert surveys[1] is None
+    assert "Broken Group" in caplog.text
+
+
+class FakeOpenAI:
+    """Minimal stand-in for openai.AsyncOpenAI covering the files and batches endpoints."""
+
+    def __init__(self, batch, file_contents):
+        self.uploads = []
+        self._batch = batch
+        self._file_contents = file_contents
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    async def _create_file(self, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file-input")
+
+    async def _file_content(self, file_id):
+        return SimpleNamespace(text=self._file_contents[file_id])
+
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", input_file_id=input_file_id)
+
+    async def _retrieve_batch(self, batch_id):
+        return self._batch
+
+
+def _output_line(group_id, content):
+    return json.dumps({
+        "custom_id": group_id,
+        "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}},
+    })
+
+
+def _error_line(group_id):
+    return json.dumps({
+        "custom_id": group_id,
+        "response": None,
+        "error": {"code": "invalid_request", "message": "Bad request"},
+    })
+
+
+def test_generate_surveys_batch_uploads_one_request_per_job(agent, monkeypatch):
+    client = FakeOpenAI(batch=None, file_contents={})
+    monkeypatch.setattr(survey, "AsyncOpenAI", lambda: client)
+
+    batch_id = asyncio.run(agent.generate_surveys_batch([
+        dict(_group("Working Group"), group_id="g1", project_goal="Roll out the new ERP", project_name="ERP"),
+        dict(_group("Other Group"), group_id="g2", project_goal="Roll out the new ERP", project_name="ERP"),
+    ]))
+
+    assert batch_id == "batch-1"
+    (filename, payload), purpose = client.uploads[0]
+    assert purpose == "batch"
+    requests = [json.loads(line) for line in payload.decode("utf-8").splitlines()]
+    assert [r["custom_id"] for r in requests] == ["g1", "g2"]
+    assert requests[0]["body"]["model"] == "fake-model"
+    assert requests[0]["body"]["messages"][0]["content"] == agent.system_message.content
+
+
+def test_collect_batch_maps_failed_requests_to_none(agent, monkeypatch):
+    batch = SimpleNamespace(status="completed", output_file_id="file-out", error_file_id="file-err")
+    client = FakeOpenAI(batch, {
+        "file-out": "\n".join([_output_line("g1", SURVEY_JSON), _output_line("g2", "not json")]),
+        "file-err": _error_line("g3") + "\n",
+    })
+    monkeypatch.setattr(survey, "AsyncOpenAI", lambda: client)
+
+    surveys = asyncio.run(agent.collect_batch("batch-1", poll_interval=0))
+
+    assert surveys["g1"].title == "Pulse check"
+    assert surveys["g2"] is None
+    assert surveys["g3"] is None
+
+
+def test_collect_batch_without_output_file_reports_errors(agent, monkeypatch):
+    batch = SimpleNamespace(status="completed", output_file_id=None, error_file_id="file-err")
+    client = FakeOpenAI(batch, {"file-err": "\n".join([_error_line("g1"), _error_line("g2")])})
+    monkeypatch.setattr(survey, "AsyncOpenAI", lambda: client)
+
+    assert asyncio.run(agent.collect_batch("batch-1", poll_interval=0)) == {"g1": None, "g2": None}
+
+
+@pytest.mark.parametrize("rating, expects_reference", [(8, True), (4, False)])
+def test_indicator_reference_included_without_weak_areas(agent, rating, expects_reference):
+    group = _group("Working Group")
+    group["impulse_history"] = [{"date": "2024-05-01", "average_rating": rating, "ratings": {"empowerment": rating}}]
+
+    user_message, weak_areas = agent._build_user_message(project_goal="Goal", project_name="ERP", **group)
+
+    assert bool(weak_areas) is not expects_reference
+    assert (load_prompt("survey", "indicators_reference") in user_message) is expects_reference
+
+
+def test_indicator_reference_included_without_history(agent):
+    user_message, weak_areas = agent._build_user_message(
+        project_goal="Goal", project_name="ERP", **_group("Working Group")
+    )
+
+    assert weak_areas == []
+    assert load_prompt("survey", "indicators_reference") in user_message